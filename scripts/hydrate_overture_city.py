@@ -7,29 +7,38 @@ Fetches POIs from Overture Maps S3 via DuckDB and loads into Supabase with data
 import sys
 import os
 import json
-import duckdb
-import psycopg2
 import time  # For sleep between batches
-from psycopg2.extras import execute_values
+import multiprocessing
+from collections import deque
+from psycopg2.errors import DeadlockDetected, SerializationFailure
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, TimeoutError as FuturesTimeout
 import requests
 
 # Import from hydration modules
-from hydration.utils import load_config, build_category_map, sanitize_name, parse_street_address
+from hydration.utils import (
+    load_config, build_category_map, sanitize_name, parse_street_address, compile_curation_rules,
+    lower_category, dumps_json_bytes
+)
 from hydration.deduplication import deduplicate_pois_in_memory, POIColumn
-from hydration.validation import validate_category_name, check_taxonomy_hierarchy, filter_osm_red_flags
-from hydration.scoring import calculate_scores, apply_scoring_modifiers, calculate_taxonomy_weight
+from hydration.validation import validate_category_name, filter_osm_red_flags
+from hydration.scoring import calculate_scores, apply_scoring_modifiers, calculate_taxonomy_weight, ICONIC_BONUS
 from hydration.ai_matcher import (
     generate_hotlist,
     get_cached_hotlist,
     save_hotlist_to_cache,
     ai_match_iconic_venues
 )
-from hydration.database import upsert_city_to_registry, fetch_city_from_registry
+from hydration.database import (
+    upsert_city_to_registry, fetch_city_from_registry, copy_rows_binary, upsert_source_links,
+    get_pg_pool, release_pg_connection
+)
 from hydration.geofencing import (
+    open_overture_connection,
     fetch_city_polygons,
     fetch_city_neighborhoods,
     resolve_poi_neighborhood,
     compute_poi_boundary,
+    compute_point_boundaries,
     export_geojson_by_category,
     AREA_CATEGORIES,
     POINT_CATEGORIES
@@ -37,6 +46,72 @@ from hydration.geofencing import (
 from shapely import wkb as shapely_wkb
 
 
+# staging_places (column, type), in the order staging rows are built
+STAGING_COLUMNS = (
+    ('name', 'text'), ('category', 'text'), ('geom_wkb_hex', 'text'),
+    ('street', 'text'), ('house_number', 'text'), ('neighborhood', 'text'),
+    ('city', 'text'), ('state', 'text'), ('postal_code', 'text'),
+    ('country_code', 'text'), ('relevance_score', 'int4'), ('confidence', 'float8'),
+    ('original_category', 'text'), ('overture_id', 'text'), ('overture_raw', 'jsonb'),
+    ('boundary_wkb_hex', 'text')
+)
+
+
+# Overture places scan into a temp table (bound per city: $xmin/$ymin/$xmax/$ymax
+# bbox, $categories whitelist, $forbidden_terms lowercased taxonomy terms).
+# Exact duplicates (same name, freeform address and category) are collapsed by
+# DuckDB's window operator, so the Python fuzzy dedup only sees one row per exact
+# group. POIs without a name or address are never collapsed here. The staging hex
+# of the WKB is encoded here in one vectorized pass (POIColumn.GEOM_WKB_HEX).
+CITY_PLACES_SQL = """
+CREATE TEMP TABLE city_places AS
+SELECT *,
+  lower(hex(geom_wkb)) AS geom_wkb_hex,
+  CASE WHEN name IS NULL OR street IS NULL THEN 1
+       ELSE row_number() OVER exact_dup END AS exact_dup_rank,
+  CASE WHEN name IS NULL OR street IS NULL THEN overture_id
+       ELSE first_value(overture_id) OVER exact_dup END AS exact_winner_id
+FROM (
+  SELECT 
+    id AS overture_id,
+    JSON_EXTRACT_STRING(names, 'primary') AS name,
+    taxonomy.primary AS overture_category,
+    taxonomy.alternates AS alternate_categories,
+    ST_AsWKB(geometry) AS geom_wkb,
+    addr.freeform AS street,
+    NULL AS house_number,  -- number field doesn't exist in Overture schema
+    addr.locality AS neighborhood,
+    addr.postcode AS postal_code,
+    addr.region AS state,
+    confidence,
+    sources[1] AS source_raw,
+    websites,
+    socials,
+    len(sources) AS source_magnitude,
+    (brand IS NOT NULL) AS has_brand,
+    taxonomy.hierarchy AS taxonomy_hierarchy
+  FROM (
+    -- First address projected once; the fields above read the struct directly
+    SELECT *, addresses[1] AS addr
+    FROM read_parquet('s3://overturemaps-us-west-2/release/2026-02-18.0/theme=places/type=place/*', filename=true, hive_partitioning=1)
+  ) AS places
+  WHERE 
+    bbox.xmin >= $xmin AND bbox.xmax <= $xmax
+    AND bbox.ymin >= $ymin AND bbox.ymax <= $ymax
+    AND list_contains($categories, taxonomy.primary)
+    AND NOT list_contains($forbidden_terms, lower(taxonomy.primary))
+    AND NOT coalesce(list_has_any(list_transform(taxonomy.hierarchy, lambda x: lower(x)), $forbidden_terms), false)
+    AND confidence >= 0.5
+    AND (operating_status IS NULL OR operating_status = 'open')
+  LIMIT 500000
+) AS scanned
+WINDOW exact_dup AS (
+  PARTITION BY lower(name), street, overture_category
+  ORDER BY confidence DESC, overture_id
+)
+"""
+
+
 def load_curation_config():
     """Load all curation configurations from JSON files."""
     config_dir = os.path.join(os.path.dirname(__file__), '..', 'config', 'curation')
@@ -50,54 +125,92 @@ def load_curation_config():
     with open(os.path.join(config_dir, 'taxonomy_rules.json'), 'r', encoding='utf-8') as f:
         taxonomy_config = json.load(f)
     
-    return {
+    # Lowercase match terms once at load time - per-row checks compare against
+    # already-lowercased names/categories and never re-lowercase the config
+    names_config['blacklist'] = tuple(t.lower() for t in names_config['blacklist'])
+    # Exact-match terms: frozenset gives O(1) membership per category/ancestor
+    taxonomy_config['forbidden_hierarchy_terms'] = frozenset(
+        t.lower() for t in taxonomy_config.get('forbidden_hierarchy_terms', [])
+    )
+    taxonomy_config['osm_red_flags'] = {
+        key: tuple(v.lower() for v in values)
+        for key, values in taxonomy_config.get('osm_red_flags', {}).items()
+    }
+    for weight_data in taxonomy_config.get('taxonomy_weights', {}).values():
+        weight_data['categories'] = tuple(c.lower() for c in weight_data['categories'])
+    for rule in taxonomy_config.get('cross_validation_rules', {}).values():
+        for terms_key in ('required_terms', 'forbidden_terms'):
+            if terms_key in rule:
+                rule[terms_key] = tuple(t.lower() for t in rule[terms_key])
+    
+    config = {
         'categories': categories_config,
         'names': names_config,
         'taxonomy': taxonomy_config
     }
+    config['compiled'] = compile_curation_rules(config)
+    return config
 
 
 def apply_scoring_modifiers(relevance_score, internal_category, overture_category, config,
-                             taxonomy_hierarchy=None):
+                             taxonomy_hierarchy=None, overture_lower=None, internal_lower=None):
     """Apply taxonomic penalties and boosts to relevance score.
     
     Returns: (modified_score, modifier_applied)
     - Penalties: fast_food 0.25x, gas_station 0.15x, etc
     - Boosts: stadium 2.0x, university 1.8x, etc
+    
+    overture_lower/internal_lower: optional pre-lowercased categories
     """
-    modifiers = config.get('categories', {}).get('scoring_modifiers', {})
-    if not modifiers:
+    compiled = config.get('compiled') or compile_curation_rules(config)
+    if not compiled.has_modifiers:
         return (relevance_score, 1.0)
     
-    penalties = modifiers.get('penalties', {})
-    boosts = modifiers.get('boosts', {})
+    if overture_lower is None:
+        overture_lower = lower_category(overture_category)
+    if internal_lower is None:
+        internal_lower = lower_category(internal_category)
+    
+    # The modifier depends only on the category combination, which repeats
+    # heavily across POIs - resolve each combination once per run
+    cache_key = (overture_lower, tuple(taxonomy_hierarchy or ()), internal_lower)
+    modifier_cache = compiled.modifier_cache
+    modifier = modifier_cache.get(cache_key)
+    if modifier is None:
+        modifier = _resolve_scoring_modifier(compiled, overture_lower, taxonomy_hierarchy, internal_lower)
+        modifier_cache[cache_key] = modifier
     
+    modified_score = int(relevance_score * modifier)
+    return (modified_score, modifier)
+
+
+
+def _resolve_scoring_modifier(compiled, overture_lower, taxonomy_hierarchy, internal_lower):
+    """Resolve the penalty/boost multiplier for one category combination."""
     modifier = 1.0
     
     # Check PRIMARY TAXONOMY penalties
-    taxonomy_primary = penalties.get('taxonomy_primary', {})
-    overture_lower = overture_category.lower() if overture_category else ''
+    taxonomy_primary = compiled.taxonomy_primary
     if overture_lower in taxonomy_primary:
         modifier = min(modifier, taxonomy_primary[overture_lower])
     
     # Check HIERARCHY KEYWORD penalties — scan both primary and full hierarchy path
-    taxonomy_keywords = penalties.get('taxonomy_hierarchy_keywords', {})
-    hierarchy_str = ' '.join(taxonomy_hierarchy or []).lower()
-    combined_str = f"{overture_lower} {hierarchy_str}"
-    for keyword, penalty in taxonomy_keywords.items():
-        if keyword in combined_str:
-            modifier = min(modifier, penalty)
+    # in one regex pass; the strongest (lowest) matching penalty wins
+    keyword_pattern = compiled.keyword_pattern
+    if keyword_pattern is not None:
+        hierarchy_str = ' '.join(taxonomy_hierarchy or []).lower()
+        combined_str = f"{overture_lower} {hierarchy_str}"
+        keyword_penalties = compiled.keyword_penalties
+        for keyword in keyword_pattern.findall(combined_str):
+            modifier = min(modifier, keyword_penalties[keyword])
     
     # Check INTERNAL CATEGORY boosts (only if no penalty applied)
     if modifier >= 1.0:
-        internal_boosts = boosts.get('internal_category', {})
-        internal_lower = internal_category.lower() if internal_category else ''
+        internal_boosts = compiled.internal_boosts
         if internal_lower in internal_boosts:
             modifier = internal_boosts[internal_lower]
     
-    modified_score = int(relevance_score * modifier)
-    return (modified_score, modifier)
-
+    return modifier
 
 
 def filter_osm_source_tags(source_raw, config):
@@ -112,9 +225,10 @@ def filter_osm_source_tags(source_raw, config):
     if not tags:
         return False  # No tags = accept
     
-    osm_flags = config['taxonomy']['osm_red_flags']
+    compiled = config.get('compiled') or compile_curation_rules(config)
     
-    for key, forbidden_values in osm_flags.items():
+    # One regex per OSM key covers all of its red-flag substrings
+    for key, red_flag_pattern in compiled.osm_red_flag_patterns.items():
         tag_value = tags.get(key, '').lower()
         if not tag_value:
             continue
@@ -125,27 +239,30 @@ def filter_osm_source_tags(source_raw, config):
             if massage_type in ['spa', 'sports', 'medical', 'physiotherapy']:
                 continue
         
-        for forbidden in forbidden_values:
-            if forbidden in tag_value:
-                return True  # REJECT - has red flag
+        if red_flag_pattern.search(tag_value):
+            return True  # REJECT - has red flag
     
     return False  # ACCEPT - no red flags found
 
 
-def calculate_taxonomy_weight(category, original_category, config):
+def calculate_taxonomy_weight(category, original_category, config,
+                              category_lower=None, original_lower=None):
     """Calculate additional weight based on taxonomy hierarchy."""
-    category_lower = category.lower() if category else ''
-    original_lower = original_category.lower() if original_category else ''
+    if category_lower is None:
+        category_lower = lower_category(category)
+    if original_lower is None:
+        original_lower = lower_category(original_category)
     combined = f"{category_lower} {original_lower}"
     
-    weights = config['taxonomy']['taxonomy_weights']
+    compiled = config.get('compiled') or compile_curation_rules(config)
+    weight_pattern = compiled.weight_pattern
+    if weight_pattern is None:
+        return 0
     
-    for weight_type, weight_data in weights.items():
-        for cat in weight_data['categories']:
-            if cat in combined:
-                return weight_data['bonus']
-    
-    return 0
+    # Every matching term in one pass; the earliest weight group wins
+    weight_terms = compiled.weight_terms
+    best = min((weight_terms[term] for term in weight_pattern.findall(combined)), default=None)
+    return best[1] if best else 0
 
 
 def finalize_callback(city_id, status, error_msg=None, stats=None):
@@ -171,31 +288,90 @@ def finalize_callback(city_id, status, error_msg=None, stats=None):
 
 
 def build_category_filter(config):
-    """Build SQL IN clause from category mapping keys.
+    """Build the category whitelist bound to the places scan ($categories).
     
     This implements predicate pushdown - filtering at the DuckDB/S3 level
     instead of pulling all data and filtering in Python.
+    Blacklisted categories are removed from the whitelist here, so the scan
+    needs a single membership predicate instead of IN plus NOT IN.
     
     Returns:
-        str: Comma-separated quoted category list for SQL IN clause
+        list: Overture categories to keep
+    """
+    blacklist = set(config['categories']['blacklist'])
+    return [cat for cat in config['categories']['mapping'] if cat not in blacklist]
+
+
+def build_taxonomy_filter(config):
+    """Build the forbidden taxonomy terms bound to the places scan ($forbidden_terms).
+    
+    Same rule as check_taxonomy_hierarchy, pushed into the DuckDB scan so rejected
+    POIs never reach Python: the primary category and every hierarchy ancestor are
+    checked (case-insensitive). An empty list keeps every row.
+    
+    Returns:
+        list: Lowercased forbidden terms
+    """
+    return [term.lower() for term in config['taxonomy'].get('forbidden_hierarchy_terms', ())]
+
+
+# Rows pulled per fetchmany() call (a multiple of DuckDB's 2048-row vector)
+FETCH_CHUNK_ROWS = 8 * 2048
+
+# Inter-batch pacing: no pause while merges are healthy, back off when a merge
+# runs slow or hits lock contention (deadlock / serialization failure)
+MERGE_SLOW_MS = 5000
+MAX_BATCH_DELAY_SECONDS = 2.0
+MERGE_RETRY_ATTEMPTS = 3
+
+
+def next_batch_delay(delay, merge_ms, contended=False):
+    """Grow the inter-batch pause after a slow/contended merge, decay it otherwise."""
+    if contended or merge_ms > MERGE_SLOW_MS:
+        return min(MAX_BATCH_DELAY_SECONDS, delay * 2 + 0.25)
+    return delay * 0.5 if delay >= 0.1 else 0.0
+
+
+def with_parsed_address(row):
+    """Return the POI row with its freeform STREET split into street + house_number."""
+    # STREET and HOUSE_NUMBER are adjacent: splice the parsed pair in with slices
+    # instead of copying the row to a list and back to a tuple
+    return (
+        row[:POIColumn.STREET]
+        + parse_street_address(row[POIColumn.STREET])
+        + row[POIColumn.HOUSE_NUMBER + 1:]
+    )
+
+
+def fetch_parsed_pois(cursor, chunk_size=FETCH_CHUNK_ROWS):
+    """Drain a DuckDB result in chunks, parsing addresses as each chunk arrives.
+    
+    Only one chunk of raw tuples is alive at a time instead of the whole
+    fetchall() list plus its parsed copy.
     """
-    categories = list(config['categories']['mapping'].keys())
-    return ', '.join([f"'{cat}'" for cat in categories])
+    parsed = []
+    while True:
+        chunk = cursor.fetchmany(chunk_size)
+        if not chunk:
+            return parsed
+        parsed.extend(with_parsed_address(row) for row in chunk)
 
 
-def discover_city_from_overture(lat: float, lng: float):
+def discover_city_from_overture(lat: float, lng: float, con=None):
     """
     Discover city from Overture Maps theme=divisions dataset.
     Uses JOIN between division_area (geometries) and division (metadata).
     Filters by subtype='locality' for city-level boundaries.
+    
+    con: Optional existing DuckDB connection (see open_overture_connection)
     """
     print(f"🔍 Discovering city from Overture Divisions for point: ({lat}, {lng})")
     print("✅ Using Overture Divisions theme for city discovery")
     
-    con = duckdb.connect()
-    con.execute("INSTALL spatial; LOAD spatial;")
-    con.execute("INSTALL httpfs; LOAD httpfs;")
-    con.execute("SET s3_region='us-west-2';")
+    close_conn = False
+    if con is None:
+        con = open_overture_connection()
+        close_conn = True
     
     # Use divisions theme (replaces deprecated admins)
     # Note: If 2026-02-18.0 gives "No files found", fallback to 2024-11-13.0
@@ -220,12 +396,13 @@ def discover_city_from_overture(lat: float, lng: float):
     JOIN read_parquet('{division_path}', filename=true, hive_partitioning=1) AS div
       ON area.division_id = div.id
     WHERE div.subtype = 'locality'
-      AND ST_Within(ST_Point({lng}, {lat}), area.geometry)
+      AND ST_Within(ST_Point($lng, $lat), area.geometry)
     LIMIT 1
     """
     
-    result = con.execute(query).fetchone()
-    con.close()
+    result = con.execute(query, {'lng': lng, 'lat': lat}).fetchone()
+    if close_conn:
+        con.close()
     
     if not result:
         raise Exception(f"No locality division found for coordinates ({lat}, {lng})")
@@ -328,12 +505,278 @@ def fetch_city_from_registry(city_id: str, pg_conn):
     }
 
 
+# Upper bound on waiting for a background hotlist generation once the Overture
+# scan is done (covers the OpenAI client's timeout and retries)
+HOTLIST_WAIT_SECONDS = 300
+
+
+def collect_generated_hotlist(hotlist_future, city_id, pg_conn, timeout=HOTLIST_WAIT_SECONDS):
+    """Wait (bounded) for a background generate_hotlist call and cache the result.
+    
+    The save runs here, on pg_conn (the connection holding the city lock), so the
+    ai_city_hotlist FK check is not blocked by our own FOR UPDATE; it is committed
+    with the caller's next commit. A stuck or failed generation yields an empty
+    hotlist - the city is hydrated without iconic matching instead of hanging.
+    """
+    try:
+        hotlist = hotlist_future.result(timeout=timeout)
+    except FuturesTimeout:
+        print(f"⚠️  Hotlist generation still running after {timeout}s - continuing without iconic matching")
+        return {}
+    except Exception as e:
+        print(f"⚠️  Hotlist generation failed: {str(e)} - continuing without iconic matching")
+        return {}
+    
+    if hotlist:
+        save_hotlist_to_cache(city_id, hotlist, pg_conn)
+    return hotlist
+
+
+# Per-process city context for prepare_staging_batch (set by init_batch_worker)
+_batch_context = {}
+
+
+def init_batch_worker(context):
+    """Install the city-wide inputs shared by every batch (runs once per worker process)."""
+    _batch_context.update(context)
+
+
+def prepare_batches_in_order(executor, batches, window):
+    """Yield prepare_staging_batch results in batch order with at most window batches in flight.
+    
+    executor.map would submit every batch up front, letting prepared results pile
+    up in the parent while the (sequential) Postgres merge catches up.
+    """
+    batch_iter = iter(batches)
+    pending = deque()
+    for batch in batch_iter:
+        pending.append(executor.submit(prepare_staging_batch, batch))
+        if len(pending) >= window:
+            break
+    while pending:
+        result = pending.popleft().result()
+        # Refill before handing the result to the merge, so workers stay busy
+        next_batch = next(batch_iter, None)
+        if next_batch is not None:
+            pending.append(executor.submit(prepare_staging_batch, next_batch))
+        yield result
+
+
+def prepare_staging_batch(batch_pois):
+    """Filter, score, geofence and resolve neighborhoods for one batch of deduplicated POIs.
+    
+    No Postgres access happens here, so batches can be prepared in worker processes
+    while the parent merges earlier batches in order.
+    
+    Returns:
+        Tuple of (staging_rows, export_rows, batch_stats)
+    """
+    config = _batch_context['config']
+    category_map = _batch_context['category_map']
+    hotlist = _batch_context['hotlist']
+    city_polygons_gdf = _batch_context['city_polygons_gdf']
+    neighborhoods_gdf = _batch_context['neighborhoods_gdf']
+    city_name = _batch_context['city_name']
+    country_code = _batch_context['country_code']
+    
+    # Filter and base-score first - iconic matching only sees POIs that
+    # will actually reach staging (most rows fail validation/score gates)
+    all_pois_by_category = {}
+    # Dense list: a POI's position is its id in all_pois_by_category/iconic flags
+    scored_pois = []
+    
+    # Debug counters
+    debug_rejected = {
+        'no_cat': 0,
+        'validate_name': 0,
+        'osm_flags': 0,
+        'score': 0
+    }
+    
+    for row in batch_pois:
+        overture_cat = row[POIColumn.OVERTURE_CATEGORY]
+        internal_cat = category_map.get(overture_cat)
+        
+        if not internal_cat:
+            debug_rejected['no_cat'] += 1
+            continue
+        
+        raw_name = row[POIColumn.NAME]
+        name = sanitize_name(raw_name, config)
+        
+        if not name:
+            continue
+        
+        # Lowercase once per row - shared by every validation/scoring helper below
+        name_lower = name.lower()
+        overture_lower = lower_category(overture_cat)
+        internal_lower = lower_category(internal_cat)
+        
+        # Validation
+        if not validate_category_name(name, internal_cat, overture_cat, config, name_lower=name_lower):
+            debug_rejected['validate_name'] += 1
+            continue
+        
+        if filter_osm_source_tags(row[POIColumn.SOURCE_RAW], config):  # Fixed: was row[10] (CONFIDENCE)
+            debug_rejected['osm_flags'] += 1
+            continue
+        
+        # Scoring (iconic bonus is added after AI matching)
+        source_magnitude = row[POIColumn.SOURCE_MAGNITUDE]  # Fixed: was row[13] (SOCIALS)
+        has_brand = row[POIColumn.HAS_BRAND]  # Fixed: was row[14] (SOURCE_MAGNITUDE)
+        
+        score_result = calculate_scores(
+            float(row[POIColumn.CONFIDENCE]) if row[POIColumn.CONFIDENCE] else 0.0,
+            row[POIColumn.WEBSITES],
+            row[POIColumn.SOCIALS],
+            street=row[POIColumn.STREET],
+            house_number=row[POIColumn.HOUSE_NUMBER],
+            neighborhood=row[POIColumn.NEIGHBORHOOD],
+            source_magnitude=source_magnitude,
+            has_brand=bool(has_brand),
+            is_iconic=False,
+            config=config
+        )
+        
+        if not score_result:
+            debug_rejected['score'] += 1
+            continue
+        
+        relevance_score, bonus_flags = score_result
+        
+        # Taxonomy bonus
+        relevance_score += calculate_taxonomy_weight(
+            internal_cat, overture_cat, config,
+            category_lower=internal_lower, original_lower=overture_lower
+        )
+        
+        neighborhood = row[POIColumn.NEIGHBORHOOD]  # Fixed: was row[6] (HOUSE_NUMBER)
+        all_pois_by_category.setdefault(internal_cat, []).append((name, len(scored_pois), neighborhood))
+        scored_pois.append((name, row, internal_cat, overture_lower, internal_lower, relevance_score))
+    
+    # AI matching for this batch (reuse hotlist)
+    iconic_matches = ai_match_iconic_venues(
+        hotlist, all_pois_by_category, fuzzy_workers=_batch_context.get('fuzzy_workers', -1)
+    ) if hotlist else []
+    # One flag per scored POI (indexed by poi id) instead of a set lookup per row
+    is_iconic = bytearray(len(scored_pois))
+    for poi_id in iconic_matches:
+        is_iconic[poi_id] = 1
+    
+    # Process POIs in this batch
+    staging_rows = []
+    export_rows = []  # GeoJSON export entries
+    neighborhood_stats = {'neighborhoods': 0, 'macrohoods': 0, 'unresolved': 0}
+    # (staging row index, export index, geom_wkb) for boundaries buffered after the loop
+    point_boundary_slots = []
+    
+    for (name, row, internal_cat, overture_lower, internal_lower, relevance_score), iconic in zip(scored_pois, is_iconic):
+        overture_cat = row[POIColumn.OVERTURE_CATEGORY]
+        
+        # ICONIC BOOST: same total as scoring with is_iconic=True (applied before modifiers)
+        if iconic:
+            relevance_score += ICONIC_BONUS
+        
+        # Apply modifiers
+        relevance_score, modifier = apply_scoring_modifiers(
+            relevance_score, internal_cat, overture_cat, config,
+            taxonomy_hierarchy=row[POIColumn.TAXONOMY_HIERARCHY],
+            overture_lower=overture_lower, internal_lower=internal_lower
+        )
+        
+        # Prepare for staging
+        geom_wkb = row[POIColumn.GEOM_WKB]
+        geom_hex = row[POIColumn.GEOM_WKB_HEX]
+        
+        # ============================================================
+        # GEOFENCING: Compute boundary for this POI
+        # ============================================================
+        boundary_wkb_hex = None
+        if geom_wkb:
+            if internal_cat in AREA_CATEGORIES:
+                # Area categories need per-POI polygon matching
+                boundary_wkb_hex = compute_poi_boundary(
+                    poi_geom_wkb=geom_wkb,
+                    poi_name=name,
+                    poi_category=internal_cat,
+                    city_polygons_gdf=city_polygons_gdf,
+                    relevance_score=relevance_score
+                )
+            else:
+                # Plain safety-margin circle - buffered for the whole batch below
+                point_boundary_slots.append((len(staging_rows), len(export_rows), geom_wkb))
+        
+        # ============================================================
+        # NEIGHBORHOOD: Hierarchical spatial join with divisions
+        # ============================================================
+        resolved_neighborhood = row[POIColumn.NEIGHBORHOOD]  # Fallback to Overture locality
+        resolved_subtype = None
+        
+        if geom_wkb and neighborhoods_gdf is not None:
+            try:
+                poi_point = shapely_wkb.loads(geom_wkb)
+                resolved_name, resolved_subtype = resolve_poi_neighborhood(poi_point, neighborhoods_gdf)
+                if resolved_name:
+                    resolved_neighborhood = resolved_name
+                    if resolved_subtype == 'neighborhood':
+                        neighborhood_stats['neighborhoods'] += 1
+                    elif resolved_subtype == 'macrohood':
+                        neighborhood_stats['macrohoods'] += 1
+                else:
+                    neighborhood_stats['unresolved'] += 1
+            except Exception:
+                neighborhood_stats['unresolved'] += 1
+        
+        # Track for GeoJSON export
+        export_rows.append({
+            'name': name,
+            'category': internal_cat,
+            'relevance_score': relevance_score,
+            'boundary_wkb_hex': boundary_wkb_hex
+        })
+        
+        staging_rows.append((
+            name,
+            internal_cat,
+            geom_hex,
+            row[POIColumn.STREET],
+            row[POIColumn.HOUSE_NUMBER],
+            resolved_neighborhood,  # Use resolved neighborhood instead of Overture locality
+            city_name,
+            row[POIColumn.STATE],
+            row[POIColumn.POSTAL_CODE],
+            country_code,
+            relevance_score,
+            row[POIColumn.CONFIDENCE],
+            overture_cat,
+            row[POIColumn.OVERTURE_ID],
+            # Raw UTF-8 JSON bytes - the binary COPY sends them to jsonb without a str round-trip
+            dumps_json_bytes(row[POIColumn.SOURCE_RAW]) if row[POIColumn.SOURCE_RAW] else None,
+            boundary_wkb_hex  # NEW: boundary geometry
+        ))
+    
+    # Point boundaries: one vectorized projection/buffer for the whole batch
+    if point_boundary_slots:
+        point_hexes = compute_point_boundaries([geom_wkb for _, _, geom_wkb in point_boundary_slots])
+        for (row_idx, export_idx, _), boundary_wkb_hex in zip(point_boundary_slots, point_hexes):
+            staging_rows[row_idx] = staging_rows[row_idx][:-1] + (boundary_wkb_hex,)
+            export_rows[export_idx]['boundary_wkb_hex'] = boundary_wkb_hex
+    
+    batch_stats = {
+        'iconic_matches': len(iconic_matches),
+        'rejected': debug_rejected,
+        'neighborhoods': neighborhood_stats,
+    }
+    return staging_rows, export_rows, batch_stats
+
+
 def main():
     """Main entry point for hydration script.
     
-    Supports two modes:
+    Supports three modes:
     1. Direct mode: python hydrate_overture_city.py [city_id] [lat] [lng] [is_update]
     2. Worker mode: python hydrate_overture_city.py --worker
+    3. Hotlist prefetch: python hydrate_overture_city.py --prefetch-hotlists [max_cities]
     """
     # Check for worker mode flag
     if len(sys.argv) > 1 and sys.argv[1] == '--worker':
@@ -343,6 +786,14 @@ def main():
         worker_main_loop(max_runtime_seconds=1500)  # 25 minutes
         return
     
+    if len(sys.argv) > 1 and sys.argv[1] == '--prefetch-hotlists':
+        # Offline backfill - batch-generate hotlists for pending cities
+        from hydration.queue import prefetch_pending_hotlists
+        print("🔧 Starting in PREFETCH MODE - batch hotlist generation")
+        max_cities = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+        prefetch_pending_hotlists(max_cities=max_cities)
+        return
+    
     # Direct mode - process single city
     print("🔧 Starting in DIRECT MODE - single city processing")
     
@@ -363,30 +814,48 @@ def main():
     # Initialize city_id for error handler
     city_id = city_id_arg
     pg_conn = None
+    con = None
+    batch_executor = None
     
     try:
         config = load_curation_config()
         
         # Process in batches (10000k records per commit - balanced for performance/safety)
         BATCH_SIZE = 5000
-        pg_conn = psycopg2.connect(os.environ['DB_POOLER_URL'])
+        
+        # DuckDB: one connection (extensions + S3 config loaded once) shared by
+        # city discovery, the places scan, polygons and neighborhoods
+        con = open_overture_connection()
+        
+        # PostgreSQL: Connect via Pooler (port 6543)
+        # Single connection for the whole hydration (one TLS handshake per run)
+        pg_conn = get_pg_pool(os.environ['DB_POOLER_URL']).getconn()
+        # One cursor on the one connection for the whole run
         pg_cur = pg_conn.cursor()
         
-        # ATOMIC LOCK: Try to acquire exclusive lock on city
+        # ATOMIC LOCK: Try to acquire exclusive lock on city and mark it 'processing'
+        # in one round trip. RETURNING reports the status from before the update.
         print(f"🔍 Looking for city at ({lat}, {lng})...")
-        check_sql = """
-        SELECT id, city_name, country_code, bbox, status
-        FROM cities_registry
-        WHERE ST_Contains(geom, ST_SetSRID(ST_MakePoint(%s, %s), 4326))
-        FOR UPDATE SKIP LOCKED
-        LIMIT 1
+        lock_sql = """
+        WITH target AS (
+            SELECT id, status
+            FROM cities_registry
+            WHERE ST_Contains(geom, ST_SetSRID(ST_MakePoint(%s, %s), 4326))
+            FOR UPDATE SKIP LOCKED
+            LIMIT 1
+        )
+        UPDATE cities_registry AS c
+        SET status = 'processing', updated_at = NOW()
+        FROM target
+        WHERE c.id = target.id
+        RETURNING c.id, c.city_name, c.country_code, c.bbox, target.status
         """
         
-        pg_cur.execute(check_sql, (lng, lat))
+        pg_cur.execute(lock_sql, (lng, lat))
         existing_city = pg_cur.fetchone()
         
         if existing_city:
-            # Got the lock - update status and process
+            # Got the lock (status already set to 'processing' - NO COMMIT, keep lock!)
             city_id = existing_city[0]
             city_name = existing_city[1]
             current_status = existing_city[4]
@@ -396,14 +865,9 @@ def main():
             # Skip if already completed (unless is_update=true)
             if current_status == 'completed' and not is_update:
                 print(f"⏭️  City already completed, skipping (use is_update=true to force re-hydration)")
-                pg_conn.close()
+                pg_conn.rollback()  # Undo the 'processing' mark and release the lock
                 sys.exit(0)
             
-            # Update to processing (NO COMMIT - keep lock!)
-            pg_cur.execute(
-                "UPDATE cities_registry SET status = 'processing', updated_at = NOW() WHERE id = %s",
-                (city_id,)
-            )
             # CRITICAL: Do NOT commit here - lock must persist until processing completes
             print("✅ Status updated to 'processing' (lock held)")
             
@@ -416,7 +880,7 @@ def main():
             # Couldn't lock - either doesn't exist OR already locked by another worker
             # Try to discover (if doesn't exist, will insert)
             print("⚠️  Could not lock city (doesn't exist or locked by another worker)")
-            city_data = discover_city_from_overture(lat, lng)
+            city_data = discover_city_from_overture(lat, lng, con=con)
             
             # Try to insert/upsert
             city_id = upsert_city_to_registry(city_data, pg_conn)
@@ -424,48 +888,33 @@ def main():
             if not city_id:
                 # Another worker is processing this city
                 print("❌ City is being processed by another worker, aborting")
-                pg_conn.close()
                 sys.exit(0)  # Exit gracefully
             
             city_name = city_data['city_name']
         
         bbox = city_data['bbox']
-        pg_cur = pg_conn.cursor()
         
         print(f"\n📍 Processing: {city_name}")
         print(f"📦 BBox: {bbox}")
         
         # Load POIs from Overture Maps via DuckDB
         category_map = config['categories']['mapping']
-        category_blacklist = config['categories']['blacklist']
-        
-        # Metrics tracking
-        metrics = {
-            'total_found': 0,
-            'rejected_category': 0,
-            'rejected_taxonomy': 0,
-            'rejected_osm_tags': 0,
-            'rejected_name': 0,
-            'rejected_validation': 0,
-            'rejected_confidence': 0,
-            'final_sent_to_staging': 0
-        }
-        
-        # PostgreSQL: Connect via Pooler (port 6543)
-        pg_conn = psycopg2.connect(os.environ['DB_POOLER_URL'])
-        pg_cur = pg_conn.cursor()
         
-        # Try to get cached hotlist first (30-day cache)
+        # Try to get cached hotlist first (30-day cache) - on pg_conn, which holds
+        # the city lock (see collect_generated_hotlist)
         hotlist = get_cached_hotlist(city_id, pg_conn)
+        hotlist_future = None
         if not hotlist:
-            # Generate AI hotlist if not cached
-            hotlist = generate_hotlist(
+            # OpenAI generation is network-bound and touches no database - run it on
+            # a thread while DuckDB (which releases the GIL) scans Overture
+            hotlist_executor = ThreadPoolExecutor(max_workers=1)
+            hotlist_future = hotlist_executor.submit(
+                generate_hotlist,
                 city_name,
                 state=city_data.get('state'),
                 country_code=city_data.get('country_code')
             )
-            if hotlist:
-                save_hotlist_to_cache(city_id, hotlist, pg_conn)
+            hotlist_executor.shutdown(wait=False)
         
         # ====================================================================
         # DUCKDB QUERY: Fetch POIs with predicate pushdown
@@ -475,70 +924,44 @@ def main():
         print(f"   Only fetching social POIs (bars, restaurants, parks, etc.)")
         
         # DuckDB: Query Overture with category filter
-        con = duckdb.connect(':memory:')
-        con.execute("INSTALL spatial; LOAD spatial;")
-        con.execute("INSTALL httpfs; LOAD httpfs;")
+        # Overture places are not hive-partitioned by country - pruning comes from
+        # bbox row-group statistics, so keep parquet footers cached across reads
+        con.execute("SET parquet_metadata_cache = true;")
         
         category_map = config['categories']['mapping']
-        category_filter = build_category_filter(config)
-        category_blacklist = config['categories']['blacklist']
-        blacklist_sql = ', '.join([f"'{cat}'" for cat in category_blacklist])
-        
-        query = f"""
-        SELECT 
-          id AS overture_id,
-          JSON_EXTRACT_STRING(names, 'primary') AS name,
-          taxonomy.primary AS overture_category,
-          taxonomy.alternates AS alternate_categories,
-          ST_AsWKB(geometry) AS geom_wkb,
-          addresses[1].freeform AS street,
-          NULL AS house_number,  -- number field doesn't exist in Overture schema
-          addresses[1].locality AS neighborhood,
-          addresses[1].postcode AS postal_code,
-          addresses[1].region AS state,
-          confidence,
-          sources[1] AS source_raw,
-          websites,
-          socials,
-          len(sources) AS source_magnitude,
-          (brand IS NOT NULL) AS has_brand,
-          taxonomy.hierarchy AS taxonomy_hierarchy
-        FROM read_parquet('s3://overturemaps-us-west-2/release/2026-02-18.0/theme=places/type=place/*', filename=true, hive_partitioning=1)
-        WHERE 
-          bbox.xmin >= {bbox[0]} AND bbox.xmax <= {bbox[2]}
-          AND bbox.ymin >= {bbox[1]} AND bbox.ymax <= {bbox[3]}
-          AND taxonomy.primary IN ({category_filter})
-          AND taxonomy.primary NOT IN ({blacklist_sql})
-          AND confidence >= 0.5
-          AND (operating_status IS NULL OR operating_status = 'open')
-        LIMIT 500000
-        """
+        # Single S3 scan into a temp table; exact duplicates collapsed in DuckDB
+        # (bbox, category whitelist and forbidden taxonomy are bound as parameters)
+        con.execute(CITY_PLACES_SQL, {
+            'xmin': float(bbox[0]), 'ymin': float(bbox[1]),
+            'xmax': float(bbox[2]), 'ymax': float(bbox[3]),
+            'categories': build_category_filter(config),
+            'forbidden_terms': build_taxonomy_filter(config),
+        })
+        # Streamed in vector-sized chunks and parsed on the fly (see fetch_parsed_pois)
+        print(f"🏠 Fetching POIs and parsing addresses to extract house numbers...")
+        all_pois = fetch_parsed_pois(con.execute(
+            "SELECT * EXCLUDE (exact_dup_rank, exact_winner_id) FROM city_places WHERE exact_dup_rank = 1"
+        ))
+        # Losers carry their exact-group winner id as the last column
+        exact_duplicates = con.execute(
+            "SELECT * EXCLUDE (exact_dup_rank) FROM city_places WHERE exact_dup_rank > 1"
+        ).fetchall()
+        # Rows now live in Python - free the temp table, keep the connection for polygons
+        con.execute("DROP TABLE city_places")
         
-        all_pois = con.execute(query).fetchall()
-        con.close()
+        # Scan done - wait (bounded) for a hotlist generated alongside it
+        if hotlist_future is not None:
+            hotlist = collect_generated_hotlist(hotlist_future, city_id, pg_conn)
         
-        total_pois = len(all_pois)
-        print(f"✅ Loaded {total_pois:,} social POIs (filtered at source)")
-        
-        # Parse addresses to extract street and house_number from freeform
-        print(f"🏠 Parsing addresses to extract house numbers...")
-        parsed_pois = []
-        for row in all_pois:
-            # Parse freeform address (index 5 = street)
-            freeform = row[POIColumn.STREET]
-            street, house_number = parse_street_address(freeform)
-            
-            # Replace freeform with parsed street and add house_number
-            parsed_row = list(row)
-            parsed_row[POIColumn.STREET] = street
-            parsed_row[POIColumn.HOUSE_NUMBER] = house_number
-            parsed_pois.append(tuple(parsed_row))
-        
-        all_pois = parsed_pois
+        total_pois = len(all_pois) + len(exact_duplicates)
+        print(f"✅ Loaded {total_pois:,} social POIs (filtered at source, "
+              f"{len(exact_duplicates):,} exact duplicates collapsed in DuckDB)")
         print(f"✅ Parsed {len(all_pois):,} addresses")
         
         if total_pois == 0:
             print("⚠️  No POIs found in this city!")
+            # Keep the cached hotlist and release the city row before the callback updates it
+            pg_conn.commit()
             finalize_callback(city_id, 'completed', stats={'inserted': 0, 'updated': 0})
             return
         
@@ -546,7 +969,7 @@ def main():
         # GEOFENCING: Fetch city polygons for boundary enrichment
         # ====================================================================
         print(f"\n🗺️ Fetching polygons for geofencing...")
-        city_polygons_gdf = fetch_city_polygons(bbox)
+        city_polygons_gdf = fetch_city_polygons(bbox, con=con)
         if city_polygons_gdf is not None:
             print(f"   ✅ Loaded {len(city_polygons_gdf):,} polygons for boundary matching")
         else:
@@ -556,7 +979,10 @@ def main():
         # NEIGHBORHOOD ENRICHMENT: Hierarchical spatial join with divisions
         # ====================================================================
         print(f"\n🏘️  Loading neighborhood polygons for spatial join...")
-        neighborhoods_gdf = fetch_city_neighborhoods(bbox)
+        neighborhoods_gdf = fetch_city_neighborhoods(bbox, con=con)
+        # Last DuckDB read of the run
+        con.close()
+        con = None
         
         # Track neighborhood resolution statistics
         neighborhood_stats = {'neighborhoods': 0, 'macrohoods': 0, 'unresolved': 0}
@@ -569,13 +995,31 @@ def main():
         # SIMPLE DEDUP: Remove exact duplicates (same name + street + house_number)
         # ====================================================================
         print(f"\n🧹 Removing exact duplicates from {total_pois:,} POIs...")
-        from hydration.deduplication import deduplicate_pois_in_memory
         
         # Non-destructive architecture: preserve ALL POI data
         deduplicated_pois, duplicate_mappings, all_pois_data = deduplicate_pois_in_memory(all_pois, config)
+        # Winners reuse the original tuples and all_pois_data holds every row by id -
+        # the full fetch list is no longer needed for the (long) batch phase
+        del all_pois
+        
+        # Fold in the exact duplicates collapsed by DuckDB: keep their rows for
+        # source linking and map them to wherever their exact winner ended up
+        for duplicate in exact_duplicates:
+            loser_row = with_parsed_address(duplicate[:-1])
+            loser_id, exact_winner_id = loser_row[POIColumn.OVERTURE_ID], duplicate[-1]
+            all_pois_data[loser_id] = loser_row
+            duplicate_mappings[loser_id] = duplicate_mappings.get(exact_winner_id, exact_winner_id)
+        del exact_duplicates
+        
         total_unique = len(deduplicated_pois)
         total_duplicates = len(duplicate_mappings)
         
+        # winner overture_id -> loser overture_ids, for linking losers batch by batch
+        losers_by_winner = {}
+        for loser_id, winner_id in duplicate_mappings.items():
+            if winner_id != loser_id:
+                losers_by_winner.setdefault(winner_id, []).append(loser_id)
+        
         print(f"✅ Deduplication complete: {total_unique:,} unique POIs ({total_duplicates:,} exact duplicates removed)")
         
         # ====================================================================
@@ -590,11 +1034,42 @@ def main():
         
         total_inserted = 0
         total_updated = 0
+        batch_delay = 0.0  # Adaptive inter-batch pause (see next_batch_delay)
+        
+        # Batches are independent until they reach Postgres: prepare them in worker
+        # processes (forked, so the city context is inherited, not pickled per batch)
+        # and merge the results sequentially in batch order below
+        batch_context = {
+            'config': config,
+            'category_map': category_map,
+            'hotlist': hotlist,
+            'city_polygons_gdf': city_polygons_gdf,
+            'neighborhoods_gdf': neighborhoods_gdf,
+            'city_name': city_name,
+            'country_code': city_data.get('country_code'),
+        }
+        batches = [deduplicated_pois[i:i + BATCH_SIZE] for i in range(0, total_unique, BATCH_SIZE)]
+        batch_workers = min(num_batches, max(1, (os.cpu_count() or 1) - 1))
+        # Stage 1 fuzzy matching is multi-threaded (rapidfuzz cdist): split the
+        # cores between batch workers instead of each one claiming all of them
+        batch_context['fuzzy_workers'] = max(1, (os.cpu_count() or 1) // batch_workers) if batch_workers > 1 else -1
+        if batch_workers > 1:
+            print(f"   ⚙️  Preparing batches on {batch_workers} worker processes")
+            batch_executor = ProcessPoolExecutor(
+                max_workers=batch_workers,
+                # Explicit fork: the context is inherited instead of pickled per worker
+                # (forkserver/spawn are the default on newer Pythons and on macOS)
+                mp_context=multiprocessing.get_context('fork'),
+                initializer=init_batch_worker,
+                initargs=(batch_context,)
+            )
+            prepared_batches = prepare_batches_in_order(batch_executor, batches, window=batch_workers * 2)
+        else:
+            init_batch_worker(batch_context)
+            prepared_batches = map(prepare_staging_batch, batches)
         
         for batch_num in range(num_batches):
-            start_idx = batch_num * BATCH_SIZE
-            end_idx = min(start_idx + BATCH_SIZE, total_unique)
-            batch_pois = deduplicated_pois[start_idx:end_idx]
+            batch_pois = batches[batch_num]
             
             # Detect if this is the final batch
             is_final_batch = (batch_num == num_batches - 1)
@@ -602,193 +1077,48 @@ def main():
             print(f"{'='*70}")
             print(f"[BATCH {batch_num+1}/{num_batches}] Processing {len(batch_pois)} POIs... (Final Batch: {is_final_batch})")
             
-            # Collect POIs for AI matching
-            all_pois_by_category = {}
-            poi_data = {}
-            
-            for row in batch_pois:
-                overture_cat = row[POIColumn.OVERTURE_CATEGORY]
-                internal_cat = category_map.get(overture_cat)
-                
-
-                if not internal_cat:
-                    continue
-                
-                raw_name = row[POIColumn.NAME]
-                sanitized_name = sanitize_name(raw_name, config)
-                
-                if not sanitized_name:
-                    continue
-                
-                poi_id = len(poi_data)
-                neighborhood = row[POIColumn.NEIGHBORHOOD]  # Fixed: was row[6] (HOUSE_NUMBER)
-                
-                if internal_cat not in all_pois_by_category:
-                    all_pois_by_category[internal_cat] = []
-                
-                all_pois_by_category[internal_cat].append((sanitized_name, poi_id, neighborhood))
-                poi_data[poi_id] = (sanitized_name, row)
-            
-            # AI matching for this batch (reuse hotlist)
-            iconic_matches = ai_match_iconic_venues(hotlist, all_pois_by_category) if hotlist else []
-            iconic_ids = set(iconic_matches)
-            
-            print(f"   🤖 AI matched {len(iconic_ids)} iconic venues in this batch")
-            
-            # Process POIs in this batch
-            staging_rows = []
-            
-            # Debug counters
-            debug_rejected = {
-                'no_cat': 0,
-                'validate_name': 0,
-                'taxonomy': 0,
-                'osm_flags': 0,
-                'score': 0
-            }
-            
-            for poi_id, (name, row) in poi_data.items():
-                overture_cat = row[POIColumn.OVERTURE_CATEGORY]
-                internal_cat = category_map.get(overture_cat)
-                
-                if not internal_cat:
-                    debug_rejected['no_cat'] += 1
-                    continue
-                
-                # Validation
-                if not validate_category_name(name, internal_cat, overture_cat, config):
-                    debug_rejected['validate_name'] += 1
-                    continue
-                
-                if not check_taxonomy_hierarchy(internal_cat, overture_cat, row[POIColumn.ALTERNATE_CATEGORIES], config,
-                                                taxonomy_hierarchy=row[POIColumn.TAXONOMY_HIERARCHY]):
-                    debug_rejected['taxonomy'] += 1
-                    continue
-                
-                if filter_osm_source_tags(row[POIColumn.SOURCE_RAW], config):  # Fixed: was row[10] (CONFIDENCE)
-                    debug_rejected['osm_flags'] += 1
-                    continue
-                
-                # Scoring
-                is_iconic = poi_id in iconic_ids
-                source_magnitude = row[POIColumn.SOURCE_MAGNITUDE]  # Fixed: was row[13] (SOCIALS)
-                has_brand = row[POIColumn.HAS_BRAND]  # Fixed: was row[14] (SOURCE_MAGNITUDE)
-                
-                score_result = calculate_scores(
-                    float(row[POIColumn.CONFIDENCE]) if row[POIColumn.CONFIDENCE] else 0.0,
-                    row[POIColumn.WEBSITES],
-                    row[POIColumn.SOCIALS],
-                    street=row[POIColumn.STREET],
-                    house_number=row[POIColumn.HOUSE_NUMBER],
-                    neighborhood=row[POIColumn.NEIGHBORHOOD],
-                    source_magnitude=source_magnitude,
-                    has_brand=bool(has_brand),
-                    is_iconic=is_iconic,
-                    config=config
-                )
-                
-                if not score_result:
-                    debug_rejected['score'] += 1
-                    continue
-                
-                relevance_score, bonus_flags = score_result
-                
-                # Taxonomy bonus
-                taxonomy_bonus = calculate_taxonomy_weight(internal_cat, overture_cat, config)
-                relevance_score += taxonomy_bonus
-                
-                # Apply modifiers
-                relevance_score, modifier = apply_scoring_modifiers(
-                    relevance_score, internal_cat, overture_cat, config,
-                    taxonomy_hierarchy=row[POIColumn.TAXONOMY_HIERARCHY]
-                )
-                
-                # Prepare for staging
-                geom_wkb = row[POIColumn.GEOM_WKB]
-                geom_hex = geom_wkb.hex() if geom_wkb else None
-                
-                # ============================================================
-                # GEOFENCING: Compute boundary for this POI
-                # ============================================================
-                boundary_wkb_hex = None
-                if geom_wkb:
-                    boundary_wkb_hex = compute_poi_boundary(
-                        poi_geom_wkb=geom_wkb,
-                        poi_name=name,
-                        poi_category=internal_cat,
-                        city_polygons_gdf=city_polygons_gdf,
-                        relevance_score=relevance_score
-                    )
-                
-                # ============================================================
-                # NEIGHBORHOOD: Hierarchical spatial join with divisions
-                # ============================================================
-                resolved_neighborhood = row[POIColumn.NEIGHBORHOOD]  # Fallback to Overture locality
-                resolved_subtype = None
-                
-                if geom_wkb and neighborhoods_gdf is not None:
-                    try:
-                        poi_point = shapely_wkb.loads(geom_wkb)
-                        resolved_name, resolved_subtype = resolve_poi_neighborhood(poi_point, neighborhoods_gdf)
-                        if resolved_name:
-                            resolved_neighborhood = resolved_name
-                            if resolved_subtype == 'neighborhood':
-                                neighborhood_stats['neighborhoods'] += 1
-                            elif resolved_subtype == 'macrohood':
-                                neighborhood_stats['macrohoods'] += 1
-                        else:
-                            neighborhood_stats['unresolved'] += 1
-                    except Exception:
-                        neighborhood_stats['unresolved'] += 1
-                
-                # Track for GeoJSON export
-                all_pois_with_boundaries.append({
-                    'name': name,
-                    'category': internal_cat,
-                    'relevance_score': relevance_score,
-                    'boundary_wkb_hex': boundary_wkb_hex
-                })
-                
-                staging_rows.append((
-                    name,
-                    internal_cat,
-                    geom_hex,
-                    row[POIColumn.STREET],
-                    row[POIColumn.HOUSE_NUMBER],
-                    resolved_neighborhood,  # Use resolved neighborhood instead of Overture locality
-                    city_name,
-                    row[POIColumn.STATE],
-                    row[POIColumn.POSTAL_CODE],
-                    city_data.get('country_code'),
-                    relevance_score,
-                    row[POIColumn.CONFIDENCE],
-                    overture_cat,
-                    row[POIColumn.OVERTURE_ID],
-                    json.dumps(row[POIColumn.SOURCE_RAW]) if row[POIColumn.SOURCE_RAW] else None,
-                    boundary_wkb_hex  # NEW: boundary geometry
-                ))
+            # Filter/score/geofence results for this batch (computed in order by the pool)
+            staging_rows, export_rows, batch_stats = next(prepared_batches)
+            all_pois_with_boundaries.extend(export_rows)
+            for stat_key, stat_count in batch_stats['neighborhoods'].items():
+                neighborhood_stats[stat_key] += stat_count
+            debug_rejected = batch_stats['rejected']
             
+            print(f"   🤖 AI matched {batch_stats['iconic_matches']} iconic venues in this batch")
             print(f"   ✅ Processed {len(staging_rows)} valid POIs")
-            print(f"   🐛 DEBUG Rejections: no_cat={debug_rejected['no_cat']}, validate_name={debug_rejected['validate_name']}, taxonomy={debug_rejected['taxonomy']}, osm_flags={debug_rejected['osm_flags']}, score={debug_rejected['score']}")
+            print(f"   🐛 DEBUG Rejections: no_cat={debug_rejected['no_cat']}, validate_name={debug_rejected['validate_name']}, osm_flags={debug_rejected['osm_flags']}, score={debug_rejected['score']}")
             
             # Insert to staging
             if staging_rows:
-                insert_sql = """
-                INSERT INTO staging_places (
-                  name, category, geom_wkb_hex, street, house_number,
-                  neighborhood, city, state, postal_code, country_code,
-                  relevance_score, confidence, original_category,
-                  overture_id, overture_raw, boundary_wkb_hex
-                ) VALUES %s
-                """
-                
-                execute_values(pg_cur, insert_sql, staging_rows, page_size=500)
-                print(f"   💾 Inserted to staging")
-                
-                # Merge to production (pass bbox for timestamp+spatial soft delete)
+                # Staging load, merge (pass bbox for timestamp+spatial soft delete), duplicate
+                # links and the staging truncate share ONE transaction: staging_places is
+                # global, so its rows must never be committed where another run could merge them
                 merge_sql = "SELECT * FROM merge_staging_to_production(%s, %s, %s)"
-                pg_cur.execute(merge_sql, (city_id, bbox, is_final_batch))
-                merge_result = pg_cur.fetchone()
+                merge_contended = False
+                merge_started = time.perf_counter()
+                for attempt in range(1, MERGE_RETRY_ATTEMPTS + 1):
+                    # Savepoint per attempt: a retry undoes only this batch's load + merge,
+                    # not the city lock / cached hotlist earlier in the transaction
+                    pg_cur.execute("SAVEPOINT batch_merge")
+                    try:
+                        # COPY streams the batch in one round trip with no per-row SQL parsing
+                        copy_rows_binary(pg_cur, 'staging_places', STAGING_COLUMNS, staging_rows)
+                        pg_cur.execute(merge_sql, (city_id, bbox, is_final_batch))
+                        merge_result = pg_cur.fetchone()
+                        pg_cur.execute("RELEASE SAVEPOINT batch_merge")
+                        break
+                    except (DeadlockDetected, SerializationFailure) as lock_error:
+                        # Drops the staging rows too - they are reloaded on the next attempt
+                        pg_cur.execute("ROLLBACK TO SAVEPOINT batch_merge")
+                        merge_contended = True
+                        if attempt == MERGE_RETRY_ATTEMPTS:
+                            raise
+                        batch_delay = next_batch_delay(batch_delay, 0, contended=True)
+                        print(f"   ⚠️  Merge hit lock contention ({type(lock_error).__name__}), retrying in {batch_delay:.2f}s...")
+                        time.sleep(batch_delay)
+                merge_ms = (time.perf_counter() - merge_started) * 1000
+                batch_delay = next_batch_delay(batch_delay, merge_ms, contended=merge_contended)
+                print(f"   💾 Inserted to staging")
                 
                 if merge_result:
                     inserted, updated, sources_updated, deactivated = merge_result
@@ -800,81 +1130,90 @@ def main():
                     if is_final_batch and deactivated > 0:
                         print(f"   🗑️  Soft deleted: {deactivated} missing places (final batch cleanup)")
                 
-                # CRITICAL: Commit transaction (releases locks!)
-                pg_conn.commit()
-                print(f"   ✅ Transaction committed")
-                
                 # CRITICAL IDEMPOTENCY FIX: Link duplicate overture_ids to winners
                 # This prevents re-processing the same POIs next month
+                # Losers are not in batch_pois (it holds winners) - pick up the ones
+                # merged into this batch's winners and resolve every winner's
+                # place_id in one query instead of one SELECT per loser
                 duplicate_links = []
-                for row in batch_pois:
-                    overture_id = row[POIColumn.OVERTURE_ID]
-                    winner_id = duplicate_mappings.get(overture_id, overture_id)
+                batch_winner_ids = [
+                    row[POIColumn.OVERTURE_ID] for row in batch_pois
+                    if row[POIColumn.OVERTURE_ID] in losers_by_winner
+                ]
+                if batch_winner_ids:
+                    pg_cur.execute(
+                        "SELECT external_id, place_id FROM place_sources WHERE provider = 'overture' AND external_id = ANY(%s)",
+                        (batch_winner_ids,)
+                    )
+                    winner_to_place = dict(pg_cur.fetchall())
                     
-                    # Only process if this is a "loser" (merged into another)
-                    if winner_id != overture_id:
-                        # Find the place_id of the winner
-                        pg_cur.execute(
-                            "SELECT place_id FROM place_sources WHERE provider = 'overture' AND external_id = %s",
-                            (winner_id,)
-                        )
-                        winner_place = pg_cur.fetchone()
-                        
-                        if winner_place:
+                    for winner_id in batch_winner_ids:
+                        winner_place_id = winner_to_place.get(winner_id)
+                        if winner_place_id is None:
+                            continue  # Winner did not reach production (filtered out)
+                        for overture_id in losers_by_winner[winner_id]:
+                            source_raw = all_pois_data[overture_id][POIColumn.SOURCE_RAW]
                             duplicate_links.append((
-                                winner_place[0],  # place_id (winner's)
+                                winner_place_id,  # place_id (winner's)
                                 'overture',
                                 overture_id,  # external_id (loser's)
-                                json.dumps(row[POIColumn.SOURCE_RAW]) if row[POIColumn.SOURCE_RAW] else None  # Fixed: was row[10] (CONFIDENCE)
+                                dumps_json_bytes(source_raw) if source_raw else None
                             ))
                 
-                # Batch insert duplicate links
+                # Bulk upsert duplicate links (COPY into a temp table + one INSERT ... SELECT)
                 if duplicate_links:
-                    link_sql = """
-                    INSERT INTO place_sources (place_id, provider, external_id, raw, created_at)
-                    VALUES %s
-                    ON CONFLICT (provider, external_id) DO UPDATE SET
-                        place_id = EXCLUDED.place_id,
-                        raw = EXCLUDED.raw,
-                        created_at = NOW()
-                    """
-                    execute_values(pg_cur, link_sql, 
-                                 [(pid, prov, eid, raw, 'NOW()') for pid, prov, eid, raw in duplicate_links])
-                    pg_conn.commit()
+                    upsert_source_links(pg_cur, duplicate_links)
                     print(f"   🔗 Linked {len(duplicate_links)} duplicate IDs to winners")
                 
                 # CRITICAL: Truncate staging for next batch
                 pg_cur.execute("TRUNCATE staging_places")
+                
+                # CRITICAL: One commit for staging load + merge + links + truncate (releases locks!)
                 pg_conn.commit()
                 print(f"   🧹 Staging truncated")
+                print(f"   ✅ Transaction committed")
+            else:
+                # Nothing survived filtering - no merge ran, so there is nothing to pace
+                print(f"   ⏭️  No valid POIs in batch, skipping merge")
+                continue
             
-            # CRITICAL: Sleep between batches (database recovery)
-            if batch_num < num_batches - 1:
-                print(f"   😴 Sleeping 2s for database recovery...")
-                time.sleep(2)
+            # Pause between batches only while merges show database pressure
+            if batch_num < num_batches - 1 and batch_delay > 0:
+                print(f"   😴 Sleeping {batch_delay:.2f}s for database recovery...")
+                time.sleep(batch_delay)
+        
+        if batch_executor is not None:
+            batch_executor.shutdown()
+            batch_executor = None
         
-        # Close connections
+        # Close cursor (the connection goes back to the pool in finally)
         pg_cur.close()
-        pg_conn.close()
         
-        # Final report
-        print(f"\n{'='*70}")
-        print(f"🎯 BATCH PROCESSING COMPLETE: {city_name}")
-        print(f"{'='*70}")
-        print(f"Total POIs found:    {total_pois:,}")
-        print(f"Batches processed:   {num_batches}")
-        print(f"Total inserted:      {total_inserted:,}")
-        print(f"Total updated:       {total_updated:,}")
-        print(f"{'='*70}")
-        
-        # NEIGHBORHOOD QUALITY LOG
-        total_classified = neighborhood_stats['neighborhoods'] + neighborhood_stats['macrohoods']
-        print(f"\n[DATA-INFO] {city_name}: {total_classified:,} bairros identificados "
-              f"({neighborhood_stats['neighborhoods']:,} neighborhoods, "
-              f"{neighborhood_stats['macrohoods']:,} macrohoods)")
-        if neighborhood_stats['unresolved'] > 0:
-            coverage_pct = (total_classified / (total_classified + neighborhood_stats['unresolved'])) * 100 if (total_classified + neighborhood_stats['unresolved']) > 0 else 0
-            print(f"   ⚠️  {neighborhood_stats['unresolved']:,} POIs sem bairro ({coverage_pct:.1f}% cobertura)")
+        # Final report (built once, written with a single stdout call)
+        neighborhoods_count, macrohoods_count, unresolved_count = (
+            neighborhood_stats['neighborhoods'], neighborhood_stats['macrohoods'], neighborhood_stats['unresolved']
+        )
+        total_classified = neighborhoods_count + macrohoods_count
+        report_lines = [
+            f"\n{'='*70}",
+            f"🎯 BATCH PROCESSING COMPLETE: {city_name}",
+            f"{'='*70}",
+            f"Total POIs found:    {total_pois:,}",
+            f"Batches processed:   {num_batches}",
+            f"Total inserted:      {total_inserted:,}",
+            f"Total updated:       {total_updated:,}",
+            f"{'='*70}",
+            # NEIGHBORHOOD QUALITY LOG
+            f"\n[DATA-INFO] {city_name}: {total_classified:,} bairros identificados "
+            f"({neighborhoods_count:,} neighborhoods, "
+            f"{macrohoods_count:,} macrohoods)",
+        ]
+        if unresolved_count > 0:
+            # unresolved_count > 0 guarantees a non-zero denominator
+            coverage_pct = total_classified / (total_classified + unresolved_count) * 100
+            report_lines.append(f"   ⚠️  {unresolved_count:,} POIs sem bairro ({coverage_pct:.1f}% cobertura)")
+        sys.stdout.write('\n'.join(report_lines) + '\n')
+        sys.stdout.flush()
         
         # ====================================================================
         # GEOJSON EXPORT: Generate audit files for visual verification
@@ -890,6 +1229,9 @@ def main():
             'geojson_exported': sum(geojson_stats.values()) if geojson_stats else 0
         }
         
+        # Nothing may be left uncommitted (e.g. the hotlist when every batch was
+        # empty) and the callback must not wait on our lock on the city row
+        pg_conn.commit()
         finalize_callback(city_id, 'completed', stats=stats)
         
     except Exception as e:
@@ -901,12 +1243,16 @@ def main():
         sys.exit(1)
     
     finally:
-        # CRITICAL: Always close connection to release locks
+        if con is not None:
+            con.close()
+        if batch_executor is not None:
+            batch_executor.shutdown(wait=False, cancel_futures=True)
+        # CRITICAL: Always release connection to release locks
         if pg_conn:
             try:
-                pg_conn.rollback()  # Rollback any uncommitted transaction
-                pg_conn.close()
-                print("🔓 Database connection closed")
+                # Rolls back any uncommitted transaction; broken connections are discarded
+                release_pg_connection(os.environ['DB_POOLER_URL'], pg_conn)
+                print("🔓 Database connection released")
             except Exception as cleanup_error:
                 print(f"⚠️  Error during cleanup: {cleanup_error}", file=sys.stderr)
 
@@ -4,7 +4,7 @@ Modular structure for maintainability and testability.
 """
 
 # Utils
-from .utils import load_config, build_category_map, sanitize_name
+from .utils import load_config, build_category_map, sanitize_name, compile_curation_rules, CompiledConfig, lower_category, dumps_json_bytes, dumps_json_text, loads_json
 
 # Validation
 from .validation import (
@@ -17,14 +17,17 @@ from .validation import (
 from .scoring import (
     calculate_scores,
     apply_scoring_modifiers,
-    calculate_taxonomy_weight
+    calculate_taxonomy_weight,
+    ICONIC_BONUS
 )
 
 # AI Matcher
 from .ai_matcher import (
     generate_hotlist,
+    generate_hotlists_batch,
     get_cached_hotlist,
     save_hotlist_to_cache,
+    save_hotlists_to_cache,
     find_candidates_for_iconic,
     ai_validate_matches_batch,
     ai_match_iconic_venues
@@ -33,13 +36,20 @@ from .ai_matcher import (
 # Database
 from .database import (
     upsert_city_to_registry,
-    fetch_city_from_registry
+    fetch_city_from_registry,
+    copy_rows_binary,
+    upsert_source_links,
+    get_pg_pool,
+    release_pg_connection,
+    pooled_connection
 )
 
 # Geofencing
 from .geofencing import (
+    open_overture_connection,
     fetch_city_polygons,
     compute_poi_boundary,
+    compute_point_boundaries,
     export_geojson_by_category,
     AREA_CATEGORIES,
     POINT_CATEGORIES,
@@ -51,6 +61,12 @@ __all__ = [
     'load_config',
     'build_category_map',
     'sanitize_name',
+    'compile_curation_rules',
+    'CompiledConfig',
+    'lower_category',
+    'dumps_json_bytes',
+    'dumps_json_text',
+    'loads_json',
     # Validation
     'validate_category_name',
     'check_taxonomy_hierarchy',
@@ -59,19 +75,29 @@ __all__ = [
     'calculate_scores',
     'apply_scoring_modifiers',
     'calculate_taxonomy_weight',
+    'ICONIC_BONUS',
     # AI Matcher
     'generate_hotlist',
+    'generate_hotlists_batch',
     'get_cached_hotlist',
     'save_hotlist_to_cache',
+    'save_hotlists_to_cache',
     'find_candidates_for_iconic',
     'ai_validate_matches_batch',
     'ai_match_iconic_venues',
     # Database
     'upsert_city_to_registry',
     'fetch_city_from_registry',
+    'copy_rows_binary',
+    'upsert_source_links',
+    'get_pg_pool',
+    'release_pg_connection',
+    'pooled_connection',
     # Geofencing
+    'open_overture_connection',
     'fetch_city_polygons',
     'compute_poi_boundary',
+    'compute_point_boundaries',
     'export_geojson_by_category',
     'AREA_CATEGORIES',
     'POINT_CATEGORIES',
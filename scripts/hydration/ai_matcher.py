@@ -2,38 +2,86 @@
 AI-powered iconic venue matching system.
 Generates hotlist with OpenAI, caches in DB, and validates matches semantically.
 """
-import os
+import hashlib
 import json
-from openai import OpenAI
-from rapidfuzz import fuzz
-
-
-def generate_hotlist(city_name, state=None, country_code=None):
-    """Generate categorized hotlist of iconic venues using OpenAI gpt-4o.
-    
-    Args:
-        city_name: Name of the city
-        state: State/region code (e.g., 'SP', 'PR') for disambiguation
-        country_code: Country code (e.g., 'BR') for additional context
-    
-    Returns: dict with categories as keys (e.g., {"bar": [...], "nightclub": [...]}) or empty dict if API fails
-    """
-    # Build location string with state and country for disambiguation
-    location = city_name
-    if state:
-        location = f"{city_name}, {state}"
-    if country_code:
-        location = f"{location}, {country_code}"
-    
-    api_key = os.getenv('OPENAI_API_KEY')
-    if not api_key:
-        print("⚠️  OPENAI_API_KEY not set - skipping AI hotlist generation")
-        return {}
-    
-    try:
-        client = OpenAI(api_key=api_key)
-        
-        prompt = f"""You are NOT generating a list.
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timezone
+import numpy as np
+from psycopg2.extras import Json
+from rapidfuzz import fuzz, process
+
+from .database import pooled_connection
+from .utils import dumps_json_bytes, dumps_json_text, loads_json
+
+# Concurrent OpenAI validation calls per ai_match_iconic_venues run
+AI_VALIDATION_WORKERS = 6
+
+# Iconic entries per validation request (compact one-line payloads keep this cheap)
+AI_VALIDATION_BATCH_SIZE = 60
+
+# Shared OpenAI client (one HTTPX connection pool, created on first use).
+# Bounded timeout so a hung request can't stall a batch; the SDK retries
+# connection errors, 429s and 5xx with backoff
+OPENAI_TIMEOUT_SECONDS = 60
+OPENAI_MAX_RETRIES = 3
+# Keep-alive pool size: covers AI_VALIDATION_WORKERS threads plus batch/file calls
+OPENAI_MAX_CONNECTIONS = 32
+_openai_client = None
+_openai_client_lock = threading.Lock()
+
+
+def get_openai_client(api_key=None):
+    """Return the process-wide OpenAI client so calls reuse keep-alive sockets."""
+    global _openai_client
+    if _openai_client is None:
+        with _openai_client_lock:
+            if _openai_client is None:
+                # Imported on first use: cache-hit runs never pay for loading
+                # the SDK (httpx, pydantic)
+                import httpx
+                from openai import DefaultHttpxClient, OpenAI
+                _openai_client = OpenAI(
+                    api_key=api_key or os.getenv('OPENAI_API_KEY'),
+                    timeout=OPENAI_TIMEOUT_SECONDS,
+                    max_retries=OPENAI_MAX_RETRIES,
+                    # Concurrent validation threads each keep a warm socket
+                    # instead of re-handshaking once the default pool is full
+                    http_client=DefaultHttpxClient(limits=httpx.Limits(
+                        max_connections=OPENAI_MAX_CONNECTIONS,
+                        max_keepalive_connections=OPENAI_MAX_CONNECTIONS
+                    ))
+                )
+    return _openai_client
+
+
+def _reset_openai_client():
+    """Drop the inherited client in forked children (its sockets belong to the parent)."""
+    global _openai_client, _openai_client_lock
+    _openai_client = None
+    _openai_client_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_openai_client)
+
+
+# Hotlist generation settings (also recorded with each cached hotlist)
+# List recall works well on the mini tier; "high" keeps the large model for edge cases
+HOTLIST_MODELS = {
+    'standard': "gpt-4.1-mini",
+    'high': "gpt-4.1",  # Latest model as of Jan 2026
+}
+HOTLIST_TEMPERATURE = 0.1  # Very low - prioritize factual recall, not creativity
+
+# Static system prompts: kept byte-identical across requests (per-call data goes
+# in the user message) so OpenAI's automatic prompt caching can reuse the prefix
+HOTLIST_SYSTEM_PROMPT = """You are a knowledgeable local expert for the location given by the user. Your goal is to provide comprehensive lists of REAL venues. Start with famous landmarks, then include well-established places, then local favorites. Aim for target quantities - it's expected to list 20-30 bars and restaurants if you know the city well. Only skip venues if you're uncertain they exist.
+
+You are NOT generating a list.
 You are performing FACTUAL RECOGNITION.
 
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -48,7 +96,7 @@ If a name is created by a common pattern (e.g. "Bar do X", "Café do Y"):
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 GEOGRAPHIC BOUNDARY (HARD)
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-Only include venues that are physically located in {location}.
+Only include venues that are physically located in the location given by the user.
 Do NOT include nearby cities or metropolitan regions.
 
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -109,7 +157,7 @@ OUTPUT FORMAT (STRICT)
 Return ONLY valid JSON.
 No comments. No explanations.
 
-{{
+{
   "bar": [],
   "nightclub": [],
   "restaurant": [],
@@ -119,20 +167,189 @@ No comments. No explanations.
   "cafe": [],
   "gym": [],
   "university": []
-}}
+}
 """
 
-        response = client.chat.completions.create(
-            model="gpt-4.1",  # Latest model as of Jan 2026
-            messages=[
-                {"role": "system", "content": f"You are a knowledgeable local expert for {location}. Your goal is to provide comprehensive lists of REAL venues. Start with famous landmarks, then include well-established places, then local favorites. Aim for target quantities - it's expected to list 20-30 bars and restaurants if you know the city well. Only skip venues if you're uncertain they exist."},
-                {"role": "user", "content": prompt}
-            ],
-            response_format={"type": "json_object"},
-            temperature=0.1  # Very low - prioritize factual recall, not creativity
-        )
+VALIDATION_SYSTEM_PROMPT = """You are a precise semantic validator. Return only valid JSON. Match venues by name similarity.
+
+You are a semantic validator for venues. Your task is to identify correct matches between iconic venues and real candidates.
+
+RULES:
+1. A match is valid when the candidate clearly refers to the SAME establishment as the iconic venue.
+2. Acceptable variations: '+55' = '+55 Bar', 'Parque Barigui' = 'Parque Ecológico Barigui'
+3. Accept suffix variations: 'Shopping X', 'Unit Y', etc.
+4. If NO candidate is an obvious match, return null.
+5. An entry with "iconic_names" lists several venues sharing the same candidates: judge and return each name separately.
+6. Candidates are listed once under CANDIDATES as {"id": "name"}; each venue refers to its candidates by "candidate_ids".
+
+MANDATORY RETURN FORMAT:
+{
+  "matches": [
+    {"iconic_name": "iconic_venue_name", "candidate_id": 123},
+    {"iconic_name": "another_venue", "candidate_id": 456},
+    {"iconic_name": "no_match", "candidate_id": null}
+  ]
+}
+
+IMPORTANT: 
+- candidate_id must be an INTEGER NUMBER (candidate id), NOT an array
+- Use null (not empty list) when there's no match
+- Return ONLY JSON, no additional text."""
+
+# Structured outputs (strict JSON schema): the API guarantees the response shape.
+# Strict schemas need fixed keys, so matches are a list of {iconic_name, candidate_id}
+HOTLIST_CATEGORIES = ('bar', 'nightclub', 'restaurant', 'club', 'stadium', 'park', 'cafe', 'gym', 'university')
+HOTLIST_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "iconic_hotlist",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                category: {"type": "array", "items": {"type": "string"}}
+                for category in HOTLIST_CATEGORIES
+            },
+            "required": list(HOTLIST_CATEGORIES),
+            "additionalProperties": False,
+        },
+    },
+}
+VALIDATION_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "venue_matches",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "matches": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "iconic_name": {"type": "string"},
+                            "candidate_id": {"type": ["integer", "null"]},
+                        },
+                        "required": ["iconic_name", "candidate_id"],
+                        "additionalProperties": False,
+                    },
+                },
+            },
+            "required": ["matches"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+# OpenAI Batch API polling for generate_hotlists_batch
+BATCH_POLL_SECONDS = 30
+BATCH_TERMINAL_STATUSES = ('completed', 'failed', 'expired', 'cancelled')
+
+
+def _ai_cache_path(kind, request):
+    """Disk cache file for an OpenAI request (None unless AI_CACHE_DIR is set).
+    
+    Keyed by SHA-256 of the canonical request JSON (model, prompts, payload), so
+    any prompt or model change misses the cache.
+    """
+    cache_dir = os.getenv('AI_CACHE_DIR')
+    if not cache_dir:
+        return None
+    key = hashlib.sha256(
+        json.dumps(request, sort_keys=True, ensure_ascii=False).encode('utf-8')
+    ).hexdigest()
+    return os.path.join(cache_dir, kind, f"{key}.json")
+
+
+def _read_ai_cache(path):
+    """Cached response for path, or None on miss/unreadable entry."""
+    if path is None:
+        return None
+    try:
+        with open(path, 'rb') as f:
+            return loads_json(f.read())
+    except (OSError, ValueError):
+        return None
+
+
+def _write_ai_cache(path, value):
+    """Store a response atomically (write temp file, then rename over the entry)."""
+    if path is None:
+        return
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(dumps_json_bytes(value))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"⚠️  AI cache write error: {str(e)}")
+
+
+def format_hotlist_location(city_name, state=None, country_code=None):
+    """Build location string with state and country for disambiguation."""
+    location = city_name
+    if state:
+        location = f"{city_name}, {state}"
+    if country_code:
+        location = f"{location}, {country_code}"
+    return location
+
+
+def hotlist_model(quality_tier=None):
+    """Resolve a quality tier (default: HOTLIST_QUALITY_TIER env, else 'standard') to a model."""
+    return HOTLIST_MODELS[quality_tier or os.getenv('HOTLIST_QUALITY_TIER', 'standard')]
+
+
+def build_hotlist_request(location, quality_tier=None):
+    """Chat completion kwargs for one city's hotlist (shared by sync and Batch API paths)."""
+    return {
+        "model": hotlist_model(quality_tier),
+        "messages": [
+            # Static system prefix first: identical across cities, so OpenAI's
+            # prompt cache can serve it; only the location varies
+            {"role": "system", "content": HOTLIST_SYSTEM_PROMPT},
+            {"role": "user", "content": f"Location: {location}"}
+        ],
+        "response_format": HOTLIST_RESPONSE_FORMAT,
+        "temperature": HOTLIST_TEMPERATURE,
+    }
+
+
+def generate_hotlist(city_name, state=None, country_code=None, quality_tier=None):
+    """Generate categorized hotlist of iconic venues using OpenAI (see HOTLIST_MODELS).
+    
+    Args:
+        city_name: Name of the city
+        state: State/region code (e.g., 'SP', 'PR') for disambiguation
+        country_code: Country code (e.g., 'BR') for additional context
+        quality_tier: 'standard' (mini model) or 'high' (large model)
+    
+    Returns: dict with categories as keys (e.g., {"bar": [...], "nightclub": [...]}) or empty dict if API fails
+    """
+    location = format_hotlist_location(city_name, state, country_code)
+    
+    api_key = os.getenv('OPENAI_API_KEY')
+    if not api_key:
+        print("⚠️  OPENAI_API_KEY not set - skipping AI hotlist generation")
+        return {}
+    
+    try:
+        request = build_hotlist_request(location, quality_tier)
+        cache_path = _ai_cache_path('hotlist', request)
+        result = _read_ai_cache(cache_path)
+        if result is not None:
+            print(f"📦 Using disk-cached AI hotlist for {location}")
+            return result
+        
+        client = get_openai_client(api_key)
         
-        result = json.loads(response.choices[0].message.content)
+        response = client.chat.completions.create(**request)
+        
+        result = loads_json(response.choices[0].message.content)
+        if result:
+            _write_ai_cache(cache_path, result)
         
         # Count total venues
         total_venues = sum(len(venues) for venues in result.values())
@@ -145,29 +362,131 @@ No comments. No explanations.
         return {}
 
 
-def get_cached_hotlist(city_id, pg_conn=None):
-    """Retrieve cached hotlist from database if available (no expiration).
+def generate_hotlists_batch(cities, poll_seconds=BATCH_POLL_SECONDS, max_wait_seconds=24 * 3600,
+                            quality_tier=None):
+    """Generate hotlists for many cities in one OpenAI Batch API job.
+    
+    Half the price of generate_hotlist and a separate rate-limit pool, but results
+    arrive within the 24h batch window - meant for offline backfills. Single-city
+    runs keep using generate_hotlist.
+    
+    Args:
+        cities: List of {"city_id", "city_name", "state", "country_code"} dicts
+        poll_seconds: Delay between batch status checks
+        max_wait_seconds: Stop polling after this long (the job keeps running on OpenAI)
+        quality_tier: 'standard' (mini model) or 'high' (large model)
     
-    Uses independent connection to avoid SSL issues with long-running main connection.
+    Returns: Dict of {city_id (str): hotlist} for the cities that completed
     """
-    import os
-    import psycopg2
+    api_key = os.getenv('OPENAI_API_KEY')
+    if not api_key:
+        print("⚠️  OPENAI_API_KEY not set - skipping AI hotlist batch")
+        return {}
+    if not cities:
+        return {}
     
     try:
-        # Use independent connection for hotlist operations
-        hotlist_conn = psycopg2.connect(os.environ['DB_POOLER_URL'])
-        cur = hotlist_conn.cursor()
-        cur.execute("""
-            SELECT hotlist, generated_at, venue_count
-            FROM ai_city_hotlist
-            WHERE city_id = %s
-        """, (city_id,))
-        row = cur.fetchone()
+        client = get_openai_client(api_key)
+        
+        # One /v1/chat/completions request per city, same prompt as the sync path
+        requests_jsonl = b"\n".join(
+            dumps_json_bytes({
+                "custom_id": str(city['city_id']),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": build_hotlist_request(format_hotlist_location(
+                    city['city_name'], city.get('state'), city.get('country_code')
+                ), quality_tier),
+            })
+            for city in cities
+        )
+        batch_file = client.files.create(file=("hotlists.jsonl", requests_jsonl), purpose="batch")
+        batch = client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        print(f"📤 Submitted hotlist batch {batch.id} ({len(cities)} cities)")
+        
+        deadline = time.monotonic() + max_wait_seconds
+        while batch.status not in BATCH_TERMINAL_STATUSES:
+            if time.monotonic() > deadline:
+                print(f"⚠️  Hotlist batch {batch.id} still {batch.status} - stopped waiting")
+                return {}
+            time.sleep(poll_seconds)
+            batch = client.batches.retrieve(batch.id)
+        
+        if batch.status != 'completed' or not batch.output_file_id:
+            print(f"❌ Hotlist batch {batch.id} ended as '{batch.status}'")
+            return {}
+        
+        hotlists = {}
+        for line in client.files.content(batch.output_file_id).text.splitlines():
+            if not line:
+                continue
+            item = loads_json(line)
+            response = item.get('response') or {}
+            try:
+                if response.get('status_code') != 200:
+                    raise ValueError(f"status {response.get('status_code')}")
+                hotlists[item['custom_id']] = loads_json(response['body']['choices'][0]['message']['content'])
+            except (KeyError, IndexError, ValueError) as e:
+                print(f"⚠️  Hotlist batch: no result for city {item.get('custom_id')} ({str(e)})")
+        
+        print(f"🤖 AI Hotlist Batch: {len(hotlists)}/{len(cities)} cities generated")
+        return hotlists
+        
+    except Exception as e:
+        print(f"❌ OpenAI Batch API Error: {str(e)}")
+        return {}
+
+
+@contextmanager
+def _hotlist_cursor(pg_conn=None):
+    """Cursor for hotlist cache statements.
+    
+    With pg_conn the statements join the caller's transaction inside a savepoint:
+    a failure rolls back only the cache work and the caller commits. Without it a
+    pooled DB_POOLER_URL connection is checked out and committed.
+    
+    Callers holding a row lock on the city (FOR UPDATE) must pass their own
+    connection: the ai_city_hotlist FK check needs FOR KEY SHARE on that row and
+    would wait on the lock from any other connection.
+    """
+    if pg_conn is None:
+        with pooled_connection(os.environ['DB_POOLER_URL']) as hotlist_conn:
+            with hotlist_conn.cursor() as cur:
+                yield cur
+            hotlist_conn.commit()
+        return
+    
+    cur = pg_conn.cursor()
+    try:
+        cur.execute("SAVEPOINT hotlist_cache")
+        yield cur
+        cur.execute("RELEASE SAVEPOINT hotlist_cache")
+    except Exception:
+        cur.execute("ROLLBACK TO SAVEPOINT hotlist_cache")
+        raise
+    finally:
         cur.close()
-        hotlist_conn.close()
+
+
+def get_cached_hotlist(city_id, pg_conn=None):
+    """Retrieve cached hotlist from database if available (no expiration).
+    
+    pg_conn: Caller's connection (see _hotlist_cursor); None uses a pooled one
+    """
+    try:
+        with _hotlist_cursor(pg_conn) as cur:
+            cur.execute("""
+                SELECT hotlist, generated_at, venue_count
+                FROM ai_city_hotlist
+                WHERE city_id = %s
+            """, (city_id,))
+            row = cur.fetchone()
         
         if row:
-            from datetime import datetime, timezone
             hotlist, generated_at, venue_count = row
             age_days = (datetime.now(timezone.utc) - generated_at).days
             print(f"📦 Using cached hotlist ({venue_count} venues, {age_days} days old)")
@@ -178,41 +497,130 @@ def get_cached_hotlist(city_id, pg_conn=None):
         return None
 
 
-def save_hotlist_to_cache(city_id, hotlist, pg_conn=None):
+def save_hotlist_to_cache(city_id, hotlist, pg_conn=None, quality_tier=None):
     """Save hotlist to database cache ONLY if one doesn't exist.
     
     Uses INSERT ... ON CONFLICT DO NOTHING to never overwrite existing hotlists.
-    Uses independent connection to avoid SSL issues.
+    pg_conn: Caller's connection (see _hotlist_cursor; the caller commits); None uses a pooled one
+    quality_tier: Tier the hotlist was generated with (recorded as model_version)
     """
-    import os
-    import psycopg2
-    
     try:
-        # Use independent connection for hotlist operations
-        hotlist_conn = psycopg2.connect(os.environ['DB_POOLER_URL'])
-        cur = hotlist_conn.cursor()
         venue_count = sum(len(venues) for venues in hotlist.values())
+        with _hotlist_cursor(pg_conn) as cur:
+            # DO NOTHING on conflict - never overwrite existing hotlists
+            cur.execute("""
+                INSERT INTO ai_city_hotlist (city_id, hotlist, venue_count, model_version, temperature)
+                VALUES (%s, %s, %s, %s, %s)
+                ON CONFLICT (city_id) DO NOTHING
+            """, (city_id, Json(hotlist), venue_count, hotlist_model(quality_tier), HOTLIST_TEMPERATURE))
+            inserted = cur.rowcount
         
-        # DO NOTHING on conflict - never overwrite existing hotlists
-        cur.execute("""
-            INSERT INTO ai_city_hotlist (city_id, hotlist, venue_count, model_version, temperature)
-            VALUES (%s, %s, %s, %s, %s)
-            ON CONFLICT (city_id) DO NOTHING
-        """, (city_id, json.dumps(hotlist), venue_count, 'gpt-4.1', 0.1))
-        
-        if cur.rowcount > 0:
+        if inserted > 0:
             print(f"💾 Hotlist cached to database ({venue_count} venues)")
         else:
             print(f"📦 Hotlist already exists in cache, skipping save")
-            
-        hotlist_conn.commit()
-        cur.close()
-        hotlist_conn.close()
     except Exception as e:
         print(f"⚠️  Cache save error: {str(e)}")
 
 
-def find_candidates_for_iconic(iconic_name, all_pois, category, max_candidates=5, min_similarity=70):
+def save_hotlists_to_cache(hotlists, quality_tier=None, pg_conn=None):
+    """Save many hotlists in one INSERT ... SELECT FROM unnest(...) round trip.
+    
+    Same never-overwrite semantics as save_hotlist_to_cache (ON CONFLICT DO NOTHING).
+    
+    Args:
+        hotlists: Dict of {city_id: hotlist}
+        quality_tier: Tier the hotlists were generated with (recorded as model_version)
+        pg_conn: Caller's connection (see _hotlist_cursor; the caller commits); None uses a pooled one
+    
+    Returns: Number of hotlists inserted
+    """
+    hotlists = {city_id: hotlist for city_id, hotlist in hotlists.items() if hotlist}
+    if not hotlists:
+        return 0
+    
+    try:
+        with _hotlist_cursor(pg_conn) as cur:
+            cur.execute("""
+                INSERT INTO ai_city_hotlist (city_id, hotlist, venue_count, model_version, temperature)
+                SELECT city_id, hotlist, venue_count, %s, %s
+                FROM unnest(%s::uuid[], %s::jsonb[], %s::int[]) AS t(city_id, hotlist, venue_count)
+                ON CONFLICT (city_id) DO NOTHING
+            """, (
+                hotlist_model(quality_tier), HOTLIST_TEMPERATURE,
+                [str(city_id) for city_id in hotlists],
+                [dumps_json_text(hotlist) for hotlist in hotlists.values()],
+                [sum(len(venues) for venues in hotlist.values()) for hotlist in hotlists.values()],
+            ))
+            inserted = cur.rowcount
+        print(f"💾 {inserted} hotlists cached to database ({len(hotlists) - inserted} already existed)")
+        return inserted
+    except Exception as e:
+        print(f"⚠️  Cache save error: {str(e)}")
+        return 0
+
+
+# Stage 1 hits this strong, and this far ahead of the runner-up, are accepted
+# without an LLM round-trip (the validator confirms them almost always). The
+# whole-name token_sort_ratio must also reach it: token_set_ratio scores subsets
+# ("Louvre" vs "Louvre Parking") as 100
+AUTO_ACCEPT_SIMILARITY = 95
+AUTO_ACCEPT_MARGIN = 10
+
+# Short names ("Bar", "Mercado") fuzzy-match half the city at token_set_ratio 70;
+# names shorter than this (normalized) need the stricter floor
+SHORT_NAME_LENGTH = 6
+SHORT_NAME_MIN_SIMILARITY = 85
+
+# Hotlist dedup normalization: category prefixes are stripped in list order (each
+# optional group also eats the whitespace .strip() used to), and location suffixes
+# are only walked when one of them actually ends the name
+HOTLIST_DEDUP_PREFIXES = ('restaurante ', 'bar ', 'café ', 'clube ')
+HOTLIST_DEDUP_SUFFIXES = (' batel', ' água verde', ' centro', ' shopping', ' do shopping', ' do parque', ' do museu')
+_HOTLIST_PREFIX_RE = re.compile(''.join(f'(?:{re.escape(prefix)}\\s*)?' for prefix in HOTLIST_DEDUP_PREFIXES))
+_HOTLIST_SUFFIX_RE = re.compile('(?:' + '|'.join(re.escape(suffix) for suffix in HOTLIST_DEDUP_SUFFIXES) + ')$')
+
+
+def hotlist_base_name(venue):
+    """Normalize for dedup: lowercase, remove category prefixes and location suffixes."""
+    base_name = venue.lower().strip()
+    base_name = base_name[_HOTLIST_PREFIX_RE.match(base_name).end():]
+    
+    if _HOTLIST_SUFFIX_RE.search(base_name):
+        for pattern in HOTLIST_DEDUP_SUFFIXES:
+            if base_name.endswith(pattern):
+                base_name = base_name.replace(pattern, '').strip()
+    return base_name
+
+
+def normalize_poi_names(all_pois):
+    """Lowercase/strip POI names once, for reuse across every iconic lookup."""
+    return [poi_tuple[0].lower().strip() for poi_tuple in all_pois]
+
+
+def prepare_poi_index(all_pois, poi_normalized=None):
+    """Column (SoA) view of a category's POIs, built once per category for Stage 1.
+    
+    poi_normalized: Optional normalize_poi_names(all_pois) result (skips re-normalizing)
+    
+    Returns: Dict with "names", "names_norm", "ids" (np.int64 array; object
+        array for non-integer ids) and "neighborhoods" (None when absent)
+    """
+    ids = [poi_tuple[1] for poi_tuple in all_pois]
+    try:
+        ids = np.asarray(ids, dtype=np.int64)
+    except (TypeError, ValueError, OverflowError):
+        ids = np.asarray(ids, dtype=object)
+    return {
+        "names": [poi_tuple[0] for poi_tuple in all_pois],
+        "names_norm": poi_normalized if poi_normalized is not None else normalize_poi_names(all_pois),
+        "ids": ids,
+        "neighborhoods": [poi_tuple[2] if len(poi_tuple) > 2 else None for poi_tuple in all_pois],
+    }
+
+
+def find_candidates_for_iconic(iconic_name, all_pois, category, max_candidates=5, min_similarity=70,
+                               poi_normalized=None, short_name_min_similarity=SHORT_NAME_MIN_SIMILARITY):
     """STAGE 1: Pre-filter POIs using fuzzy matching to find candidates.
     
     Args:
@@ -221,28 +629,138 @@ def find_candidates_for_iconic(iconic_name, all_pois, category, max_candidates=5
         category: Category to match
         max_candidates: Maximum candidates to return
         min_similarity: Minimum token_set_ratio score (0-100)
+        poi_normalized: Optional normalize_poi_names(all_pois) result (skips re-normalizing)
+        short_name_min_similarity: Floor for names shorter than SHORT_NAME_LENGTH (None = min_similarity)
     
     Returns: List of (poi_name, poi_id, neighborhood, similarity_score)
     """
-    candidates = []
-    iconic_normalized = iconic_name.lower().strip()
+    # One-row case of the vectorized category matcher (same scores and ordering)
+    return find_candidates_for_iconics(
+        [iconic_name], all_pois, category, max_candidates, min_similarity, poi_normalized,
+        short_name_min_similarity=short_name_min_similarity
+    )[0]
+
+
+def find_candidates_for_iconics(iconic_names, all_pois, category, max_candidates=5, min_similarity=70,
+                                poi_normalized=None, workers=-1,
+                                short_name_min_similarity=SHORT_NAME_MIN_SIMILARITY, poi_index=None):
+    """STAGE 1 for a whole category: score every iconic name against every POI at once.
     
-    for poi_tuple in all_pois:
-        poi_name = poi_tuple[0]
-        poi_id = poi_tuple[1]
-        poi_neighborhood = poi_tuple[2] if len(poi_tuple) > 2 else None
-        
-        poi_normalized = poi_name.lower().strip()
-        
-        # Calculate similarity
-        similarity = fuzz.token_set_ratio(iconic_normalized, poi_normalized)
-        
-        if similarity >= min_similarity:
-            candidates.append((poi_name, poi_id, poi_neighborhood, similarity))
+    POI names are normalized once and the iconic × POI token_set_ratio matrix is
+    computed by rapidfuzz.process.cdist in C (multi-threaded) instead of a Python
+    loop. Iconics whose normalized name equals a POI name exactly get just those
+    POIs (similarity 100) without fuzzy scoring. Iconics whose normalized name is
+    shorter than SHORT_NAME_LENGTH must reach short_name_min_similarity instead of
+    min_similarity (short names score high against too many unrelated POIs).
+    
+    poi_normalized: Optional normalize_poi_names(all_pois) result (skips re-normalizing)
+    workers: cdist threads (-1 = all cores)
+    short_name_min_similarity: Floor for short names (None = min_similarity everywhere)
+    poi_index: Optional prepare_poi_index(all_pois) result, reused across calls
+    
+    Returns: List (aligned with iconic_names) of [(poi_name, poi_id, neighborhood, similarity)]
+    """
+    if not iconic_names or not all_pois:
+        return [[] for _ in iconic_names]
+    
+    if poi_index is None:
+        poi_index = prepare_poi_index(all_pois, poi_normalized)
+    poi_normalized = poi_index["names_norm"]
+    iconic_normalized = [name.lower().strip() for name in iconic_names]
+    
+    # Exact normalized-name matches skip fuzzy scoring: those POIs are the
+    # candidates (similarity 100) and the iconic stays out of the cdist matrix
+    wanted = set(iconic_normalized)
+    exact_indices = {}
+    for idx, poi_name in enumerate(poi_normalized):
+        if poi_name and poi_name in wanted:
+            exact_indices.setdefault(poi_name, []).append(idx)
+    
+    results = []
+    fuzzy_positions = []
+    for position, name in enumerate(iconic_normalized):
+        exact = exact_indices.get(name)
+        if exact:
+            exact = exact[:max_candidates]
+            results.append(_candidate_tuples(poi_index, exact, [100.0] * len(exact)))
+        else:
+            results.append([])
+            fuzzy_positions.append(position)
+    
+    if not fuzzy_positions:
+        return results
     
-    # Sort by similarity and take top N
-    candidates.sort(key=lambda x: x[3], reverse=True)
-    return candidates[:max_candidates]
+    scores = process.cdist(
+        [iconic_normalized[position] for position in fuzzy_positions],
+        poi_normalized,
+        scorer=fuzz.token_set_ratio,
+        score_cutoff=min_similarity,
+        dtype=np.float32,
+        workers=workers
+    )
+    
+    for position, row in zip(fuzzy_positions, scores):
+        threshold = min_similarity
+        if short_name_min_similarity is not None and len(iconic_normalized[position]) < SHORT_NAME_LENGTH:
+            threshold = max(min_similarity, short_name_min_similarity)
+        # score_cutoff zeroes most of the row - sort only the surviving hits.
+        # Stable descending sort keeps POI order among equal scores (like list.sort)
+        hits = np.flatnonzero(row >= threshold)
+        top = hits[np.argsort(-row[hits], kind='stable')[:max_candidates]]
+        results[position] = _candidate_tuples(poi_index, top, row[top].tolist())
+    return results
+
+
+def is_auto_accept_match(iconic_name, candidates, min_similarity=AUTO_ACCEPT_SIMILARITY):
+    """True when the top Stage 1 candidate is unambiguous enough to skip LLM validation.
+    
+    Needs the top token_set_ratio score >= min_similarity, AUTO_ACCEPT_MARGIN above
+    the runner-up, and a whole-name token_sort_ratio >= min_similarity (subset
+    names like "Louvre" / "Louvre Parking" score 100 on token_set_ratio alone).
+    """
+    if not candidates:
+        return False
+    best_name, _, _, best_score = candidates[0]
+    if best_score < min_similarity:
+        return False
+    if len(candidates) > 1 and best_score - candidates[1][3] < AUTO_ACCEPT_MARGIN:
+        return False
+    return fuzz.token_sort_ratio(iconic_name.lower().strip(), best_name.lower().strip()) >= min_similarity
+
+
+def _candidate_tuples(poi_index, indices, similarities):
+    """[(poi_name, poi_id, neighborhood, similarity)] for POI positions in poi_index."""
+    names = poi_index["names"]
+    neighborhoods = poi_index["neighborhoods"]
+    # One gather + tolist() turns the id column back into plain Python ints
+    poi_ids = poi_index["ids"][np.asarray(indices, dtype=np.intp)].tolist()
+    return [
+        (names[idx], poi_id, neighborhoods[idx], similarity)
+        for idx, poi_id, similarity in zip(indices, poi_ids, similarities)
+    ]
+
+
+def _validation_payload(validation_batch):
+    """User message for a validation batch: shared candidate table + one venue per line.
+    
+    Iconics in a category often pull the same POIs; each candidate name is sent
+    once and venues reference candidates by id (compact JSON, no indentation).
+    """
+    candidate_names = {}
+    venue_lines = []
+    for entry in validation_batch:
+        candidate_ids = []
+        for candidate in entry["candidates"]:
+            candidate_names[candidate["id"]] = candidate["name"]
+            candidate_ids.append(candidate["id"])
+        venue = {key: value for key, value in entry.items() if key != "candidates"}
+        venue["candidate_ids"] = candidate_ids
+        venue_lines.append(dumps_json_text(venue))
+    
+    return "CANDIDATES:\n{}\n\nVENUES (one per line):\n{}".format(
+        dumps_json_text({str(poi_id): name for poi_id, name in candidate_names.items()}),
+        "\n".join(venue_lines)
+    )
 
 
 def ai_validate_matches_batch(validation_batch, api_key):
@@ -250,6 +768,7 @@ def ai_validate_matches_batch(validation_batch, api_key):
     
     Args:
         validation_batch: List of {"iconic_name": str, "candidates": [{"id": int, "name": str, "neighborhood": str}]}
+            (iconics sharing one candidate list come as a single entry with "iconic_names": [str])
         api_key: OpenAI API key
     
     Returns: Dict mapping iconic_name -> matched_poi_id (or None)
@@ -258,60 +777,59 @@ def ai_validate_matches_batch(validation_batch, api_key):
         return {}
     
     try:
-        client = OpenAI(api_key=api_key)
+        batch_data = _validation_payload(validation_batch)
         
-        # Build batch prompt
-        batch_data = json.dumps(validation_batch, ensure_ascii=False, indent=2)
-        
-        prompt = f"""You are a semantic validator for venues. Your task is to identify correct matches between iconic venues and real candidates.
-
-RULES:
-1. A match is valid when the candidate clearly refers to the SAME establishment as the iconic venue.
-2. Acceptable variations: '+55' = '+55 Bar', 'Parque Barigui' = 'Parque Ecológico Barigui'
-3. Accept suffix variations: 'Shopping X', 'Unit Y', etc.
-4. If NO candidate is an obvious match, return null.
-
-VENUES AND CANDIDATES:
-{batch_data}
-
-MANDATORY RETURN FORMAT:
-{{
-  "matches": {{
-    "iconic_venue_name": 123,
-    "another_venue": 456,
-    "no_match": null
-  }}
-}}
-
-IMPORTANT: 
-- Values must be INTEGER NUMBERS (candidate id), NOT arrays
-- Use null (not empty list) when there's no match
-- Return ONLY JSON, no additional text."""
-
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": "You are a precise semantic validator. Return only valid JSON. Match venues by name similarity."},
-                {"role": "user", "content": prompt}
+        request = {
+            "model": "gpt-4o-mini",
+            "messages": [
+                {"role": "system", "content": VALIDATION_SYSTEM_PROMPT},
+                {"role": "user", "content": batch_data}
             ],
-            response_format={"type": "json_object"},
-            temperature=0.1
-        )
+            "response_format": VALIDATION_RESPONSE_FORMAT,
+            "temperature": 0.1
+        }
+        # Identical inputs (re-runs of a city) reuse the stored verdicts
+        cache_path = _ai_cache_path('validation', request)
+        matches = _read_ai_cache(cache_path)
+        if matches is not None:
+            return matches
         
-        result = json.loads(response.choices[0].message.content)
-        return result.get('matches', {})
+        client = get_openai_client(api_key)
+        response = client.chat.completions.create(**request)
+        
+        result = loads_json(response.choices[0].message.content)
+        matches = {match['iconic_name']: match['candidate_id'] for match in result['matches']}
+        _write_ai_cache(cache_path, matches)
+        return matches
         
     except Exception as e:
+        # Too many tokens for the model: halve the batch instead of losing it
+        if getattr(e, 'code', None) == 'context_length_exceeded' and len(validation_batch) > 1:
+            half = len(validation_batch) // 2
+            print(f"   ⚠️ Validation batch of {len(validation_batch)} too large, retrying in halves")
+            matches = ai_validate_matches_batch(validation_batch[:half], api_key)
+            matches.update(ai_validate_matches_batch(validation_batch[half:], api_key))
+            return matches
         print(f"⚠️  AI validation error: {str(e)}")
         return {}
 
 
-def ai_match_iconic_venues(hotlist, all_pois_by_category):
+def ai_match_iconic_venues(hotlist, all_pois_by_category, max_concurrency=AI_VALIDATION_WORKERS,
+                           fuzzy_workers=-1, auto_accept_similarity=AUTO_ACCEPT_SIMILARITY,
+                           batch_size=AI_VALIDATION_BATCH_SIZE, max_candidates=5):
     """Complete AI matcher pipeline: pre-filter + batch validation.
     
     Args:
         hotlist: Dict of {category: [iconic_names]}
         all_pois_by_category: Dict of {category: [(name, internal_id)]}
+        max_concurrency: Max validation requests in flight at once (RPM/TPM budget)
+        fuzzy_workers: Threads for the Stage 1 similarity matrix (-1 = all cores);
+            callers already running one matcher per core should pass their share
+        auto_accept_similarity: Top candidates passing is_auto_accept_match at this
+            similarity skip LLM validation (None = always validate)
+        batch_size: Validation entries per OpenAI request (oversized batches are halved on
+            context-length errors)
+        max_candidates: Stage 1 candidates kept per iconic name
     
     Returns: Dict mapping poi_id -> iconic_name for matched venues
     """
@@ -323,32 +841,25 @@ def ai_match_iconic_venues(hotlist, all_pois_by_category):
     matched_pois = {}  # poi_id -> iconic_name
     validation_queue = []
     poi_id_to_name = {}  # Track poi_id -> poi_name for later lookup
+    entries_by_candidates = {}  # sorted candidate ids -> validation_queue entry
+    match_lines = []
+    auto_matched = 0
+    validated_count = 0  # iconic names sent to the LLM
     
     # Enhanced deduplication of hotlist items
     deduplicated_hotlist = {}
+    deduped_count = 0
     for category, venues in hotlist.items():
         if isinstance(venues, list):
             seen = set()
             deduplicated = []
             for venue in venues:
-                # Normalize for dedup: lowercase, remove location suffixes and prefixes
-                base_name = venue.lower().strip()
-                
-                # Remove category prefixes for comparison
-                for prefix in ['restaurante ', 'bar ', 'café ', 'clube ']:
-                    if base_name.startswith(prefix):
-                        base_name = base_name[len(prefix):].strip()
-                
-                # Remove common location patterns
-                for pattern in [' batel', ' água verde', ' centro', ' shopping', ' do shopping', ' do parque', ' do museu']:
-                    if base_name.endswith(pattern):
-                        base_name = base_name.replace(pattern, '').strip()
-                
+                base_name = hotlist_base_name(venue)
                 if base_name not in seen:
                     seen.add(base_name)
                     deduplicated.append(venue)
                 else:
-                    print(f"   ⚠️ Deduped: '{venue}' (similar to existing in '{category}')")
+                    deduped_count += 1
             
             deduplicated_hotlist[category] = deduplicated
         else:
@@ -356,6 +867,8 @@ def ai_match_iconic_venues(hotlist, all_pois_by_category):
     
     # Use the deduplicated hotlist for further processing
     hotlist = deduplicated_hotlist
+    if deduped_count:
+        print(f"   ⚠️ Deduped {deduped_count} near-duplicate hotlist names")
 
     # STAGE 1: Build candidates for all iconic venues
     for category, iconic_names in hotlist.items():
@@ -363,10 +876,34 @@ def ai_match_iconic_venues(hotlist, all_pois_by_category):
         if not all_pois:
             continue
         
-        for iconic_name in iconic_names:
-            candidates = find_candidates_for_iconic(iconic_name, all_pois, category)
-            
+        # POI columns (normalized names, ids) built once per category, then
+        # one vectorized similarity matrix (all iconics × all POIs)
+        category_candidates = find_candidates_for_iconics(
+            iconic_names, all_pois, category, max_candidates=max_candidates,
+            poi_index=prepare_poi_index(all_pois), workers=fuzzy_workers
+        )
+        for iconic_name, candidates in zip(iconic_names, category_candidates):
             if candidates:
+                # Unambiguous near-exact hit: accept it without validation
+                if auto_accept_similarity is not None and is_auto_accept_match(
+                        iconic_name, candidates, auto_accept_similarity):
+                    best_name, best_id, _, _ = candidates[0]
+                    matched_pois[best_id] = iconic_name
+                    auto_matched += 1
+                    match_lines.append(f"   ⚡ '{iconic_name}' → '{best_name}' (auto)")
+                    continue
+                
+                validated_count += 1
+                # Iconics with the same candidate set share one queue entry, so
+                # the candidates are sent (and counted toward a batch) only once
+                candidate_key = tuple(sorted(poi_id for _, poi_id, _, _ in candidates))
+                entry = entries_by_candidates.get(candidate_key)
+                if entry is not None:
+                    if "iconic_name" in entry:
+                        entry["iconic_names"] = [entry.pop("iconic_name")]
+                    entry["iconic_names"].append(iconic_name)
+                    continue
+                
                 # Prepare for AI validation - send only ID and name
                 candidate_list = []
                 for poi_name, poi_id, poi_neighborhood, similarity in candidates:
@@ -376,29 +913,40 @@ def ai_match_iconic_venues(hotlist, all_pois_by_category):
                     })
                     poi_id_to_name[poi_id] = poi_name
                 
-                validation_queue.append({
+                entry = {
                     "iconic_name": iconic_name,
                     "candidates": candidate_list
-                })
+                }
+                entries_by_candidates[candidate_key] = entry
+                validation_queue.append(entry)
     
-    # STAGE 2: Batch validate in chunks of 20
-    batch_size = 20
-    for i in range(0, len(validation_queue), batch_size):
-        batch = validation_queue[i:i + batch_size]
-        
-        print(f"🤖 AI validating batch {i//batch_size + 1} ({len(batch)} venues)...")
-        
-        matches = ai_validate_matches_batch(batch, api_key)
+    # STAGE 2: Batch validate in chunks - chunks are independent network
+    # calls, so they are sent concurrently (bounded to respect rate limits)
+    batch_size = max(1, batch_size)
+    batches = [validation_queue[i:i + batch_size] for i in range(0, len(validation_queue), batch_size)]
+    
+    if batches:
+        print(f"🤖 AI validating {len(validation_queue)} venues in {len(batches)} batches...")
+    llm_matched = 0
+    with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(batches)))) as executor:
+        futures = [executor.submit(ai_validate_matches_batch, batch, api_key) for batch in batches]
         
-        # Process results
-        for iconic_name, matched_id in matches.items():
-            # OpenAI sometimes returns list instead of single ID - handle both
-            if isinstance(matched_id, list):
-                matched_id = matched_id[0] if matched_id else None
+        # Results are applied in submission order so overlapping matches resolve
+        # the same way as the sequential loop did
+        for future in futures:
+            matches = future.result()
             
-            if matched_id and matched_id in poi_id_to_name:
-                matched_pois[matched_id] = iconic_name
-                print(f"   ✅ '{iconic_name}' → '{poi_id_to_name[matched_id]}'")
+            # Process results
+            for iconic_name, matched_id in matches.items():
+                if matched_id and matched_id in poi_id_to_name:
+                    matched_pois[matched_id] = iconic_name
+                    llm_matched += 1
+                    match_lines.append(f"   ✅ '{iconic_name}' → '{poi_id_to_name[matched_id]}'")
     
-    print(f"✨ AI Matcher: {len(matched_pois)} iconic venues matched")
+    # Per-venue detail and summary go out in a single write
+    match_lines.append(
+        f"✨ AI Matcher: {len(matched_pois)} iconic venues matched "
+        f"({auto_matched} auto, {llm_matched} LLM, {max(0, validated_count - llm_matched)} rejected)"
+    )
+    print("\n".join(match_lines))
     return matched_pois
@@ -2,7 +2,70 @@
 Database operations for city hydration.
 Includes city discovery, registry management, and merge operations.
 """
+import struct
+import uuid
+from contextlib import contextmanager
+
 import psycopg2
+from psycopg2.pool import ThreadedConnectionPool
+
+# COPY ... (FORMAT binary) framing: signature + flags + header extension length,
+# then per row a field count and (length, bytes) per field; -1 length is NULL
+PGCOPY_HEADER = b'PGCOPY\n\xff\r\n\x00' + struct.pack('!ii', 0, 0)
+PGCOPY_TRAILER = struct.pack('!h', -1)
+PGCOPY_NULL_FIELD = struct.pack('!i', -1)
+
+# Binary send format per Postgres column type, used by copy_rows_binary
+COPY_BINARY_ENCODERS = {
+    'text': lambda value: str(value).encode('utf-8'),
+    'int4': lambda value: struct.pack('!i', int(value)),
+    'float8': lambda value: struct.pack('!d', float(value)),
+    'uuid': lambda value: (value if isinstance(value, uuid.UUID) else uuid.UUID(str(value))).bytes,
+    # version 1 + JSON text (already-encoded bytes are sent as-is)
+    'jsonb': lambda value: b'\x01' + (value if isinstance(value, bytes) else value.encode('utf-8')),
+}
+
+
+# Process-wide connection pools, keyed by DSN (created on first use)
+_pg_pools = {}
+
+
+def get_pg_pool(dsn: str, minconn: int = 1, maxconn: int = 8):
+    """Return the shared ThreadedConnectionPool for dsn, creating it on first use."""
+    pool = _pg_pools.get(dsn)
+    if pool is None:
+        pool = _pg_pools[dsn] = ThreadedConnectionPool(minconn, maxconn, dsn=dsn)
+    return pool
+
+
+def release_pg_connection(dsn: str, pg_conn, discard: bool = False):
+    """
+    Return a pooled connection, rolling back any open transaction first.
+    
+    Broken connections (or discard=True, e.g. after an exception) are closed
+    by the pool instead of being handed out again.
+    """
+    if not pg_conn.closed and not discard:
+        try:
+            pg_conn.rollback()
+        except psycopg2.Error:
+            discard = True
+    get_pg_pool(dsn).putconn(pg_conn, close=discard or bool(pg_conn.closed))
+
+
+@contextmanager
+def pooled_connection(dsn: str):
+    """Check a connection out of the pool for one unit of work (discarded on error)."""
+    pg_conn = get_pg_pool(dsn).getconn()
+    discard = False
+    try:
+        yield pg_conn
+    except BaseException:
+        discard = True
+        raise
+    finally:
+        release_pg_connection(dsn, pg_conn, discard=discard)
+
 
 
 def upsert_city_to_registry(city_data: dict, pg_conn):
@@ -122,3 +185,113 @@ def fetch_city_from_registry(city_id: str, pg_conn):
         'country_code': result[1],
         'bbox': [result[2], result[3], result[4], result[5]]
     }
+
+
+class CopyStream:
+    """
+    Read-only file-like view over an iterator of byte chunks.
+    
+    copy_expert pulls fixed-size reads from it, so COPY payloads are encoded
+    while they are sent instead of being materialized in one buffer first.
+    """
+    
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._buffer = b''
+        self._offset = 0
+    
+    def read(self, size=-1):
+        if size is None or size < 0:
+            data = self._buffer[self._offset:] + b''.join(self._chunks)
+            self._buffer, self._offset = b'', 0
+            return data
+        
+        if len(self._buffer) - self._offset < size:
+            # Refill: keep the unread tail and pull chunks until size is covered
+            parts = [self._buffer[self._offset:]]
+            available = len(parts[0])
+            for chunk in self._chunks:
+                parts.append(chunk)
+                available += len(chunk)
+                if available >= size:
+                    break
+            self._buffer, self._offset = b''.join(parts), 0
+        
+        data = self._buffer[self._offset:self._offset + size]
+        self._offset += len(data)
+        return data
+    
+    readline = read
+
+
+def iter_copy_binary(columns, rows):
+    """Yield the COPY (FORMAT binary) payload for rows, one chunk per row."""
+    encoders = [COPY_BINARY_ENCODERS[col_type] for _, col_type in columns]
+    field_count = struct.pack('!h', len(encoders))
+    pack_length = struct.Struct('!i').pack
+    
+    yield PGCOPY_HEADER
+    for row in rows:
+        parts = [field_count]
+        for encode, value in zip(encoders, row):
+            if value is None:
+                parts.append(PGCOPY_NULL_FIELD)
+            else:
+                data = encode(value)
+                parts.append(pack_length(len(data)))
+                parts.append(data)
+        yield b''.join(parts)
+    yield PGCOPY_TRAILER
+
+
+def copy_rows_binary(pg_cur, table: str, columns, rows):
+    """
+    Bulk-load rows with COPY ... FROM STDIN (FORMAT binary).
+    
+    Values go out in Postgres' binary wire format, so the server skips text
+    parsing/lexing of every field. columns is a sequence of (name, type) pairs
+    with type in COPY_BINARY_ENCODERS; None values are sent as NULL. Rows may
+    be any iterable - they are encoded as copy_expert reads them.
+    """
+    pg_cur.copy_expert(
+        f"COPY {table} ({', '.join(name for name, _ in columns)}) FROM STDIN WITH (FORMAT binary)",
+        CopyStream(iter_copy_binary(columns, rows))
+    )
+
+
+# Columns loaded into the per-transaction link table by upsert_source_links
+SOURCE_LINK_COLUMNS = (
+    ('place_id', 'uuid'),
+    ('provider', 'text'),
+    ('external_id', 'text'),
+    ('raw', 'jsonb'),
+)
+
+
+def upsert_source_links(pg_cur, links):
+    """
+    Upsert (place_id, provider, external_id, raw) rows into place_sources.
+    
+    Rows are binary COPY-loaded into a temp table (dropped at commit) and merged
+    with a single INSERT ... SELECT ... ON CONFLICT, instead of a multi-row INSERT.
+    raw may be pre-encoded JSON bytes (sent to the jsonb column as-is).
+    Must run inside the caller's transaction.
+    """
+    pg_cur.execute("""
+        CREATE TEMP TABLE tmp_source_links (
+            place_id UUID,
+            provider TEXT,
+            external_id TEXT,
+            raw JSONB
+        ) ON COMMIT DROP
+    """)
+    copy_rows_binary(pg_cur, 'tmp_source_links', SOURCE_LINK_COLUMNS, links)
+    pg_cur.execute("""
+        INSERT INTO place_sources (place_id, provider, external_id, raw, created_at)
+        SELECT place_id, provider, external_id, raw, NOW()
+        FROM tmp_source_links
+        ON CONFLICT (provider, external_id) DO UPDATE SET
+            place_id = EXCLUDED.place_id,
+            raw = EXCLUDED.raw,
+            created_at = NOW()
+    """)
@@ -7,27 +7,30 @@ Features:
 - Spatial intersection for candidate selection
 - Category protection: different categories never merge
 - R-Tree spatial indexing for performance
+- Union-Find clustering: transitive matches collapse to one winner
 """
 
 from typing import List, Tuple, Dict, Optional, Any
 from dataclasses import dataclass
 from enum import IntEnum
+from operator import itemgetter
 from unidecode import unidecode
 
 # Optional imports
 try:
-    from rapidfuzz import fuzz
+    from rapidfuzz import fuzz, process
     HAS_RAPIDFUZZ = True
 except ImportError:
     HAS_RAPIDFUZZ = False
 
 try:
     from shapely import wkb as shapely_wkb
+    from shapely import STRtree
     from shapely.geometry import Point
-    import geopandas as gpd
-    HAS_GEOPANDAS = True
+    import numpy as np
+    HAS_SHAPELY = True
 except ImportError:
-    HAS_GEOPANDAS = False
+    HAS_SHAPELY = False
 
 
 class POIColumn(IntEnum):
@@ -49,17 +52,20 @@ class POIColumn(IntEnum):
     SOURCE_MAGNITUDE = 14
     HAS_BRAND = 15
     TAXONOMY_HIERARCHY = 16   # NEW: taxonomy.hierarchy path array
+    GEOM_WKB_HEX = 17         # GEOM_WKB hex-encoded by DuckDB (staging geom_wkb_hex)
 
 
 # Configuration constants
 FUZZY_THRESHOLD = 0.90  # 90% similarity required (avoid false positives like "Restaurante X" vs "Restaurante Y")
 # Note: Uses INTERNAL categories (after mapping). botanical_garden → park, shopping_mall → shopping
-LARGE_VENUE_CATEGORIES = {
+LARGE_VENUE_CATEGORIES = frozenset({
     'park', 'stadium', 'shopping', 'university', 'event_venue', 'club'
-}
+})
 LARGE_VENUE_THRESHOLD_M = 1500  # 1.5km - large venues with similar names are usually duplicates
 DEFAULT_THRESHOLD_M = 30
 DEG_TO_M = 111000  # Approximate meters per degree
+# cdist spreads scoring over all cores above this many candidates (thread start-up dominates below it)
+PARALLEL_SCORING_MIN_CANDIDATES = 2000
 
 
 def normalize_text(text: str) -> str:
@@ -74,12 +80,17 @@ def fuzzy_match(name1: str, name2: str) -> float:
     Calculate fuzzy similarity between two names.
     Returns value between 0.0 and 1.0.
     """
+    return normalized_similarity(normalize_text(name1), normalize_text(name2))
+
+
+def normalized_similarity(norm1: str, norm2: str) -> float:
+    """
+    Same as fuzzy_match, for names already passed through normalize_text.
+    Lets hot loops normalize each name once instead of once per comparison.
+    """
     if not HAS_RAPIDFUZZ:
         # Fallback: exact match only
-        return 1.0 if normalize_text(name1) == normalize_text(name2) else 0.0
-    
-    norm1 = normalize_text(name1)
-    norm2 = normalize_text(name2)
+        return 1.0 if norm1 == norm2 else 0.0
     
     if not norm1 or not norm2:
         return 0.0
@@ -88,6 +99,28 @@ def fuzzy_match(name1: str, name2: str) -> float:
     return fuzz.token_set_ratio(norm1, norm2) / 100.0
 
 
+def batch_similarity(norm_name: str, candidate_norms: List[str]) -> List[float]:
+    """
+    Similarity (0-100) of one normalized name against many normalized names.
+    With rapidfuzz this is a single process.cdist call (C loop) instead of
+    one Python-level scorer call per candidate.
+    """
+    if not HAS_RAPIDFUZZ:
+        # Fallback: exact match only
+        return [100.0 if norm_name == other else 0.0 for other in candidate_norms]
+    
+    if not norm_name:
+        return [0.0] * len(candidate_norms)
+    
+    return process.cdist(
+        [norm_name], candidate_norms,
+        scorer=fuzz.token_set_ratio,
+        score_cutoff=FUZZY_THRESHOLD * 100,
+        # Dense blocks (e.g. restaurants in a 1.5km downtown window) score on all cores, GIL released
+        workers=-1 if len(candidate_norms) >= PARALLEL_SCORING_MIN_CANDIDATES else 1
+    )[0]
+
+
 def is_real_polygon(geom) -> bool:
     """
     Determine if geometry is a real polygon (from Overture) vs a buffer circle.
@@ -176,24 +209,60 @@ def calculate_completeness_score(row: tuple, has_real_polygon: bool = False) ->
     return score
 
 
+def take_rows(rows: List[tuple], positions: List[int]) -> List[tuple]:
+    """Return rows[p] for each position, reusing the original tuples."""
+    if not positions:
+        return []
+    if len(positions) == 1:
+        return [rows[positions[0]]]
+    return list(itemgetter(*positions)(rows))
+
+
+def uf_find(parent: List[int], x: int) -> int:
+    """Union-Find root lookup with two-pass path compression."""
+    root = x
+    while parent[root] != root:
+        root = parent[root]
+    # Path compression (second pass)
+    while parent[x] != root:
+        parent[x], x = root, parent[x]
+    return root
+
+
+def uf_union(parent: List[int], rank: List[int], a: int, b: int) -> bool:
+    """Union by rank. Returns False if a and b were already in one set."""
+    root_a, root_b = uf_find(parent, a), uf_find(parent, b)
+    if root_a == root_b:
+        return False
+    if rank[root_a] < rank[root_b]:
+        root_a, root_b = root_b, root_a
+    parent[root_b] = root_a
+    if rank[root_a] == rank[root_b]:
+        rank[root_a] += 1
+    return True
+
+
 def deduplicate_pois_in_memory(
     pois_list: List[tuple],
-    config: dict
+    config: dict,
+    large_venue_categories: frozenset = LARGE_VENUE_CATEGORIES
 ) -> Tuple[List[tuple], Dict[str, str], Dict[str, tuple]]:
     """
     Elite deduplication with fuzzy matching and polygon dominance.
     
     Algorithm:
-    1. Build GeoDataFrame with all POIs and their boundaries
-    2. Use R-Tree spatial index to find intersecting candidates
-    3. For intersecting pairs with same category and fuzzy name match (>75%):
-       - Elect winner based on: real polygon > buffer, then completeness
-       - Map loser to winner
+    1. Parse all POI geometries into per-field lists, bucketed by category
+    2. Use an R-Tree (STRtree) per category to find intersecting candidates
+    3. Union intersecting pairs with same category and fuzzy name match (>75%)
+       into clusters (Union-Find, so matches are transitive):
+       - Elect one winner per cluster: real polygon > buffer, then completeness
+       - Map every other cluster member to that winner
     4. Also cluster by proximity + exact name (legacy behavior)
     
     Args:
         pois_list: List of tuples from DuckDB query
         config: Curation configuration dict
+        large_venue_categories: Internal categories that use the 1.5km proximity threshold
         
     Returns:
         winners: List of unique POI tuples
@@ -211,17 +280,28 @@ def deduplicate_pois_in_memory(
         overture_id = row[POIColumn.OVERTURE_ID]
         all_pois_data[overture_id] = row
     
-    # If geopandas not available, fall back to simple dedup
-    if not HAS_GEOPANDAS:
+    # If shapely not available, fall back to simple dedup
+    if not HAS_SHAPELY:
         return _simple_dedup(pois_list, config, all_pois_data, category_map)
     
     # ========================================================================
-    # PHASE 1: Build GeoDataFrame with geometries
+    # PHASE 1: Parse geometries into columnar lists
     # ========================================================================
-    print("🔬 Elite Dedup: Building spatial index...")
+    print("🔬 Elite Dedup: Parsing geometries...")
     
-    poi_geometries = []
-    for idx, row in enumerate(pois_list):
+    # Columnar lists (one list per field) instead of one dict per POI -
+    # avoids ~N dicts of per-key overhead on city-scale extracts
+    overture_ids = []
+    names = []
+    norm_names = []
+    geometries = []
+    real_polygon_flags = []
+    
+    # Hash-partition by category in the same pass: different categories never
+    # merge, so each category gets its own spatial index in phase 2
+    category_positions = {}
+    
+    for pos, row in enumerate(pois_list):
         geom_wkb = row[POIColumn.GEOM_WKB]
         geom = None
         if geom_wkb:
@@ -232,122 +312,129 @@ def deduplicate_pois_in_memory(
         
         overture_cat = row[POIColumn.OVERTURE_CATEGORY]
         internal_cat = category_map.get(overture_cat, overture_cat)
+        name = row[POIColumn.NAME]
         
-        poi_geometries.append({
-            'idx': idx,
-            'overture_id': row[POIColumn.OVERTURE_ID],
-            'name': row[POIColumn.NAME],
-            'norm_name': normalize_text(row[POIColumn.NAME]),
-            'category': internal_cat,
-            'geometry': geom,
-            'is_real_polygon': is_real_polygon(geom) if geom else False,
-            'merged_into': None  # Track if this POI was merged
-        })
-    
-    gdf = gpd.GeoDataFrame(poi_geometries, geometry='geometry', crs='EPSG:4326')
-    
-    # Build spatial index
-    gdf.sindex
+        overture_ids.append(row[POIColumn.OVERTURE_ID])
+        names.append(name)
+        norm_names.append(normalize_text(name))
+        category_positions.setdefault(internal_cat, []).append(pos)
+        geometries.append(geom)
+        real_polygon_flags.append(is_real_polygon(geom) if geom else False)
+    
+    # Winner-election score computed once per POI (not twice per matched pair)
+    completeness = np.fromiter(
+        (calculate_completeness_score(row, has_real_polygon=flag)
+         for row, flag in zip(pois_list, real_polygon_flags)),
+        dtype=np.int32, count=len(pois_list)
+    )
     
     # ========================================================================
-    # PHASE 2: Find and merge intersecting duplicates
+    # PHASE 2: Cluster intersecting duplicates (Union-Find)
     # ========================================================================
     print("🔬 Elite Dedup: Finding intersecting duplicates...")
     
+    # Weighted Union-Find: every matching pair joins one cluster, so chains
+    # like A~B, B~C end up in a single cluster with a single winner
+    parent = list(range(len(pois_list)))
+    rank = [0] * len(pois_list)
+    
     merge_count = 0
     
-    # Process each POI
-    for i, row_i in gdf.iterrows():
-        if row_i['merged_into'] is not None:
-            continue  # Already merged
-        
-        if row_i['geometry'] is None:
-            continue
+    # The loops below index the plain per-field lists by position - no
+    # iterrows()/iloc row materialization per POI or candidate
+    for category, positions in category_positions.items():
+        if len(positions) < 2:
+            continue  # Nothing to merge with
         
-        # Find candidates that intersect with this POI's geometry
-        # Use buffer for points to create search area
-        search_geom = row_i['geometry']
-        if search_geom.geom_type == 'Point':
-            # Create 1.5km search buffer for points (covers large venues)
-            search_geom = search_geom.buffer(0.015)  # ~1.5km
+        cat_sindex = STRtree([geometries[pos] for pos in positions])
         
-        possible_idx = list(gdf.sindex.query(search_geom, predicate='intersects'))
+        # Proximity fallback threshold depends only on the category
+        threshold_deg = (LARGE_VENUE_THRESHOLD_M if category in large_venue_categories
+                         else DEFAULT_THRESHOLD_M) / DEG_TO_M
         
-        for j in possible_idx:
-            if i >= j:  # Avoid duplicate comparisons
-                continue
-            
-            row_j = gdf.iloc[j]
-            
-            if row_j['merged_into'] is not None:
-                continue  # Already merged
-            
-            if row_j['geometry'] is None:
+        # Process each POI of this category
+        for i in positions:
+            geom_i = geometries[i]
+            if geom_i is None:
                 continue
             
-            # CATEGORY PROTECTION: Different categories never merge
-            if row_i['category'] != row_j['category']:
-                continue
-            
-            # FUZZY NAME MATCH: Require >75% similarity
-            similarity = fuzzy_match(row_i['name'], row_j['name'])
-            if similarity < FUZZY_THRESHOLD:
-                continue
+            # Find candidates that intersect with this POI's geometry
+            # Use buffer for points to create search area
+            search_geom = geom_i
+            if search_geom.geom_type == 'Point':
+                # Create 1.5km search buffer for points (covers large venues)
+                search_geom = search_geom.buffer(0.015)  # ~1.5km
             
-            # Check actual intersection (not just bounding box)
-            try:
-                if not row_i['geometry'].intersects(row_j['geometry']):
-                    # Check proximity as fallback
-                    dist = row_i['geometry'].distance(row_j['geometry'])
-                    threshold_deg = (LARGE_VENUE_THRESHOLD_M if row_i['category'] in LARGE_VENUE_CATEGORIES 
-                                    else DEFAULT_THRESHOLD_M) / DEG_TO_M
-                    if dist > threshold_deg:
-                        continue
-            except Exception:
+            root_i = uf_find(parent, i)
+            candidates = [
+                j for j in sorted(positions[k] for k in cat_sindex.query(search_geom, predicate='intersects'))
+                if j > i  # Avoid duplicate comparisons
+                and geometries[j] is not None
+                and uf_find(parent, j) != root_i  # Already in the same cluster
+            ]
+            if not candidates:
                 continue
             
-            # MATCH FOUND - Determine winner (polygon dominance)
-            i_score = calculate_completeness_score(
-                pois_list[row_i['idx']], 
-                has_real_polygon=row_i['is_real_polygon']
-            )
-            j_score = calculate_completeness_score(
-                pois_list[row_j['idx']], 
-                has_real_polygon=row_j['is_real_polygon']
-            )
-            
-            if i_score >= j_score:
-                winner_idx, loser_idx = i, j
-                winner_row, loser_row = row_i, row_j
-            else:
-                winner_idx, loser_idx = j, i
-                winner_row, loser_row = row_j, row_i
-            
-            # Mark loser as merged
-            gdf.at[loser_idx, 'merged_into'] = winner_row['overture_id']
-            
-            # Log the merge
-            polygon_indicator = "🔷" if winner_row['is_real_polygon'] else "⚪"
-            print(f"[DEDUP-ELITE] '{loser_row['name']}' unificado ao polígono de "
-                  f"'{winner_row['name']}' {polygon_indicator} (Similaridade: {similarity:.0%})")
+            # FUZZY NAME MATCH: score all candidates in one call
+            scores = batch_similarity(norm_names[i], [norm_names[j] for j in candidates])
             
-            merge_count += 1
+            for j, score in zip(candidates, scores):
+                if score < FUZZY_THRESHOLD * 100:
+                    continue
+                
+                if uf_find(parent, i) == uf_find(parent, j):
+                    continue  # Joined through an earlier candidate of this POI
+                
+                geom_j = geometries[j]
+                
+                # Check actual intersection (not just bounding box)
+                try:
+                    if not geom_i.intersects(geom_j):
+                        # Check proximity as fallback
+                        dist = geom_i.distance(geom_j)
+                        if dist > threshold_deg:
+                            continue
+                except Exception:
+                    continue
+                
+                # MATCH FOUND - join clusters (winner elected per cluster below)
+                if uf_union(parent, rank, i, j):
+                    merge_count += 1
     
     # ========================================================================
-    # PHASE 3: Build results
+    # PHASE 3: Elect one winner per cluster and build results
     # ========================================================================
-    winners = []
-    duplicate_mappings = {}
+    # Winner = highest completeness (polygon dominance); ties keep the first POI.
+    # Vectorized: sort by (cluster, -completeness, position) and take the
+    # first row of every cluster run
+    num_pois = len(pois_list)
+    positions_arr = np.arange(num_pois)
+    roots = np.fromiter((uf_find(parent, pos) for pos in range(num_pois)), dtype=np.int64, count=num_pois)
+    order = np.lexsort((positions_arr, -completeness.astype(np.int64), roots))
+    sorted_roots = roots[order]
+    is_first = np.empty(num_pois, dtype=bool)
+    is_first[0] = True
+    is_first[1:] = sorted_roots[1:] != sorted_roots[:-1]
+    
+    cluster_winner = np.empty(num_pois, dtype=np.int64)
+    cluster_winner[sorted_roots[is_first]] = order[is_first]
+    winner_of = cluster_winner[roots]
+    
+    # Survivors are picked straight from the original row tuples (C-level
+    # itemgetter); only losers need a per-row pass for mappings and logs
+    is_winner = winner_of == positions_arr
+    winners = take_rows(pois_list, np.flatnonzero(is_winner).tolist())
     
-    for _, row in gdf.iterrows():
-        if row['merged_into'] is None:
-            # This POI survived - it's a winner
-            winners.append(pois_list[row['idx']])
-        else:
-            # This POI was merged
-            loser_id = row['overture_id']
-            winner_id = row['merged_into']
-            duplicate_mappings[loser_id] = winner_id
+    duplicate_mappings = {}
+    for pos in np.flatnonzero(~is_winner).tolist():
+        # This POI was merged - map straight to its cluster winner
+        winner_idx = int(winner_of[pos])
+        duplicate_mappings[overture_ids[pos]] = overture_ids[winner_idx]
+        
+        # Log the merge
+        polygon_indicator = "🔷" if real_polygon_flags[winner_idx] else "⚪"
+        print(f"[DEDUP-ELITE] '{names[pos]}' unificado ao polígono de "
+              f"'{names[winner_idx]}' {polygon_indicator}")
     
     num_removed = len(pois_list) - len(winners)
     print(f"🧹 Elite Dedup: {len(pois_list)} POIs → {len(winners)} unique "
@@ -362,7 +449,7 @@ def _simple_dedup(
     all_pois_data: Dict[str, tuple],
     category_map: Dict[str, str]
 ) -> Tuple[List[tuple], Dict[str, str], Dict[str, tuple]]:
-    """Fallback simple deduplication when geopandas not available."""
+    """Fallback simple deduplication when shapely not available."""
     
     # Group by normalized name + category
     groups = {}
@@ -99,6 +99,19 @@ VALID_LAND_USE_CLASSES = {
 OVERTURE_RELEASE = '2026-02-18.0'
 
 
+def open_overture_connection():
+    """Open an in-memory DuckDB connection ready to read Overture from S3.
+    
+    Extensions are installed/loaded and the S3 region set once, so a single
+    connection can serve city discovery, the places scan and polygon fetches.
+    """
+    con = duckdb.connect(':memory:')
+    con.execute("INSTALL spatial; LOAD spatial;")
+    con.execute("INSTALL httpfs; LOAD httpfs;")
+    con.execute("SET s3_region='us-west-2';")
+    return con
+
+
 def fetch_city_polygons(bbox: List[float], con=None) -> Optional['gpd.GeoDataFrame']:
     """
     Fetch polygons from Overture land_use and buildings themes for the city.
@@ -115,13 +128,14 @@ def fetch_city_polygons(bbox: List[float], con=None) -> Optional['gpd.GeoDataFra
     
     close_conn = False
     if con is None:
-        con = duckdb.connect(':memory:')
-        con.execute("INSTALL spatial; LOAD spatial;")
-        con.execute("INSTALL httpfs; LOAD httpfs;")
-        con.execute("SET s3_region='us-west-2';")
+        con = open_overture_connection()
         close_conn = True
     
     min_lng, min_lat, max_lng, max_lat = bbox
+    bbox_params = {
+        'min_lng': float(min_lng), 'min_lat': float(min_lat),
+        'max_lng': float(max_lng), 'max_lat': float(max_lat),
+    }
     
     # Query land_use theme for parks, universities, commercial zones
     land_use_path = f"s3://overturemaps-us-west-2/release/{OVERTURE_RELEASE}/theme=base/type=land_use/*"
@@ -135,14 +149,14 @@ def fetch_city_polygons(bbox: List[float], con=None) -> Optional['gpd.GeoDataFra
         ST_AsWKB(geometry) AS geom_wkb,
         ST_Area_Spheroid(geometry) AS area_sqm
     FROM read_parquet('{land_use_path}', filename=true, hive_partitioning=1)
-    WHERE bbox.xmin >= {min_lng} AND bbox.xmax <= {max_lng}
-      AND bbox.ymin >= {min_lat} AND bbox.ymax <= {max_lat}
+    WHERE bbox.xmin >= $min_lng AND bbox.xmax <= $max_lng
+      AND bbox.ymin >= $min_lat AND bbox.ymax <= $max_lat
       AND class IN ('park', 'recreation_ground', 'university', 'college', 'retail', 'commercial', 'plaza', 'pedestrian')
     LIMIT 50000
     """
     
     try:
-        results = con.execute(query).fetchall()
+        results = con.execute(query, bbox_params).fetchall()
     except Exception as e:
         print(f"❌ Failed to query land_use: {e}")
         results = []
@@ -159,8 +173,8 @@ def fetch_city_polygons(bbox: List[float], con=None) -> Optional['gpd.GeoDataFra
         subtype,
         ST_AsWKB(geometry) AS geom_wkb
     FROM read_parquet('{buildings_path}', filename=true, hive_partitioning=1)
-    WHERE bbox.xmin >= {min_lng} AND bbox.xmax <= {max_lng}
-      AND bbox.ymin >= {min_lat} AND bbox.ymax <= {max_lat}
+    WHERE bbox.xmin >= $min_lng AND bbox.xmax <= $max_lng
+      AND bbox.ymin >= $min_lat AND bbox.ymax <= $max_lat
       AND (bbox.xmax - bbox.xmin) > 0.0005
       AND (bbox.ymax - bbox.ymin) > 0.0005
       AND subtype IN ('commercial', 'education', 'sports', 'entertainment')
@@ -169,7 +183,7 @@ def fetch_city_polygons(bbox: List[float], con=None) -> Optional['gpd.GeoDataFra
     """
     
     try:
-        buildings_results = con.execute(buildings_query).fetchall()
+        buildings_results = con.execute(buildings_query, bbox_params).fetchall()
         buildings_results = [(r[0], r[1], r[2], r[3], r[4], None) for r in buildings_results]
         results.extend(buildings_results)
     except Exception as e:
@@ -230,13 +244,14 @@ def fetch_city_neighborhoods(bbox: List[float], con=None) -> Optional['gpd.GeoDa
     
     close_conn = False
     if con is None:
-        con = duckdb.connect(':memory:')
-        con.execute("INSTALL spatial; LOAD spatial;")
-        con.execute("INSTALL httpfs; LOAD httpfs;")
-        con.execute("SET s3_region='us-west-2';")
+        con = open_overture_connection()
         close_conn = True
     
     min_lng, min_lat, max_lng, max_lat = bbox
+    bbox_params = {
+        'min_lng': float(min_lng), 'min_lat': float(min_lat),
+        'max_lng': float(max_lng), 'max_lat': float(max_lat),
+    }
     
     # Paths to divisions theme
     area_path = f"s3://overturemaps-us-west-2/release/{OVERTURE_RELEASE}/theme=divisions/type=division_area/*"
@@ -258,12 +273,12 @@ def fetch_city_neighborhoods(bbox: List[float], con=None) -> Optional['gpd.GeoDa
     JOIN read_parquet('{division_path}', filename=true, hive_partitioning=1) AS div
         ON area.division_id = div.id
     WHERE div.subtype IN ('neighborhood', 'macrohood')
-        AND area.bbox.xmin >= {min_lng} AND area.bbox.xmax <= {max_lng}
-        AND area.bbox.ymin >= {min_lat} AND area.bbox.ymax <= {max_lat}
+        AND area.bbox.xmin >= $min_lng AND area.bbox.xmax <= $max_lng
+        AND area.bbox.ymin >= $min_lat AND area.bbox.ymax <= $max_lat
     """
     
     try:
-        results = con.execute(query).fetchall()
+        results = con.execute(query, bbox_params).fetchall()
         print(f"   🏘️  Loaded {len(results)} neighborhood polygons from Overture divisions")
     except Exception as e:
         print(f"❌ Failed to query divisions: {e}")
@@ -435,6 +450,42 @@ def compute_poi_boundary(
     return None
 
 
+def compute_point_boundaries(
+    geoms_wkb: List[bytes],
+    meters: float = SAFETY_MARGIN_METERS
+) -> List[Optional[str]]:
+    """
+    Vectorized equivalent of compute_poi_boundary for point categories.
+    
+    Buffers a whole batch of POI points in one pass (a single projection to
+    EPSG:3857 and back) instead of building a GeoDataFrame per POI.
+    
+    Args:
+        geoms_wkb: POI point geometries as WKB bytes
+        meters: Buffer radius (default: safety margin)
+    
+    Returns:
+        Boundary WKB hex strings aligned with geoms_wkb (None where unparseable).
+    """
+    if not GEOPANDAS_AVAILABLE or not geoms_wkb:
+        return [None] * len(geoms_wkb)
+    
+    try:
+        points = gpd.GeoSeries.from_wkb(geoms_wkb, crs='EPSG:4326', on_invalid='ignore')
+        buffered = points.to_crs('EPSG:3857').buffer(meters).to_crs('EPSG:4326')
+        
+        # Validate geometry
+        invalid = ~buffered.is_valid & buffered.notna()
+        if invalid.any():
+            buffered[invalid] = buffered[invalid].make_valid()
+        
+        # Missing geometries come back as NaN - normalize to None
+        return [h if isinstance(h, str) else None for h in buffered.to_wkb(hex=True)]
+    except Exception as e:
+        print(f"   ⚠️ Batch buffer failed: {e}")
+        return [None] * len(geoms_wkb)
+
+
 def _find_matching_polygon(
     poi_point: 'Point',
     poi_name: str,
@@ -3,7 +3,8 @@ Worker Queue Functions for City Hydration
 Atomic queue operations with retry logic and failure tracking
 """
 import time
-import psycopg2
+
+from .database import pooled_connection
 
 
 def claim_next_city_from_queue(pg_conn):
@@ -214,17 +215,15 @@ def worker_main_loop(max_runtime_seconds=1500):  # 25 minutes default
             print(f"\n⏰ Worker timeout approaching ({elapsed//60:.1f} min), exiting gracefully")
             break
         
-        # Open fresh connection for each city (prevents connection leaks)
-        pg_conn = psycopg2.connect(DATABASE_URL)
-        
-        try:
+        # Pooled connection per city: reused across cities, rolled back on
+        # release and discarded if anything escapes (prevents connection leaks)
+        with pooled_connection(DATABASE_URL) as pg_conn:
             # 1. Claim next city from queue (atomic)
             city_data = claim_next_city_from_queue(pg_conn)
             
             if not city_data:
                 # Queue is empty
                 print("\n✅ Queue empty, worker finished")
-                pg_conn.close()
                 break
             
             city_id = city_data['id']
@@ -245,10 +244,6 @@ def worker_main_loop(max_runtime_seconds=1500):  # 25 minutes default
                 error_msg = f"Processing failed: {str(e)}"
                 print(f"❌ {error_msg}")
                 handle_city_failure(city_id, error_msg, pg_conn)
-            
-        finally:
-            # Always close connection
-            pg_conn.close()
         
         # Show progress
         print(f"\n📊 Progress: {processed_count} cities processed, {elapsed//60:.1f} min elapsed")
@@ -260,10 +255,60 @@ def worker_main_loop(max_runtime_seconds=1500):  # 25 minutes default
     print(f"   Runtime: {(time.time() - start_time)//60:.1f} minutes")
     
     # Show final queue state
-    pg_conn = psycopg2.connect(DATABASE_URL)
-    stats = get_queue_stats(pg_conn)
-    pg_conn.close()
+    with pooled_connection(DATABASE_URL) as pg_conn:
+        stats = get_queue_stats(pg_conn)
     
     print(f"\n📊 Queue Status:")
     for status, count in stats.items():
         print(f"   {status}: {count}")
+
+
+def prefetch_pending_hotlists(max_cities=500):
+    """Generate missing AI hotlists for pending cities in one Batch API job.
+    
+    Offline backfill: cities processed afterwards find their hotlist in the
+    cache instead of each paying a synchronous (full-price) OpenAI call.
+    
+    Args:
+        max_cities: Maximum pending cities included in the batch
+    
+    Returns:
+        int: Number of hotlists generated
+    """
+    import os
+    from .ai_matcher import generate_hotlists_batch, save_hotlists_to_cache
+    
+    DATABASE_URL = os.getenv('DATABASE_URL')
+    if not DATABASE_URL:
+        raise Exception("DATABASE_URL environment variable not set")
+    
+    with pooled_connection(DATABASE_URL) as pg_conn:
+        cur = pg_conn.cursor()
+        try:
+            cur.execute("""
+                SELECT r.id, r.city_name, r.country_code
+                FROM cities_registry r
+                LEFT JOIN ai_city_hotlist h ON h.city_id = r.id
+                WHERE r.status = 'pending'
+                  AND r.city_name IS NOT NULL
+                  AND h.city_id IS NULL
+                ORDER BY r.created_at ASC
+                LIMIT %s
+            """, (max_cities,))
+            cities = [
+                {'city_id': city_id, 'city_name': city_name, 'country_code': country_code}
+                for city_id, city_name, country_code in cur.fetchall()
+            ]
+        finally:
+            cur.close()
+    
+    if not cities:
+        print("✅ Every pending city already has a cached hotlist")
+        return 0
+    
+    print(f"\n📦 Prefetching hotlists for {len(cities)} pending cities (Batch API)")
+    hotlists = generate_hotlists_batch(cities)
+    # One connection and one INSERT for the whole backfill
+    save_hotlists_to_cache(hotlists)
+    
+    return len(hotlists)
@@ -3,6 +3,9 @@ POI relevance scoring system.
 Calculates scores based on data quality, social presence, and authority signals.
 """
 
+# Added to AI-identified iconic venues (guarantees the relevance cap)
+ICONIC_BONUS = 100
+
 
 def calculate_scores(confidence, websites, socials, street=None, house_number=None, neighborhood=None,
                       source_magnitude=1, has_brand=False, is_iconic=False, config=None):
@@ -11,8 +14,9 @@ def calculate_scores(confidence, websites, socials, street=None, house_number=No
     Returns: (relevance_score, bonus_flags) or None if rejected
     Uses values from config['categories']['scoring_modifiers']['base_scoring']
     """
-    # Get scoring values from config (required)
-    pts = config['categories']['scoring_modifiers']['base_scoring']
+    # Get scoring values from config (required) - resolved once when compiled
+    compiled = config.get('compiled')
+    pts = compiled.base_scoring if compiled is not None else config['categories']['scoring_modifiers']['base_scoring']
     
     has_social = False
     if socials:
@@ -42,7 +46,7 @@ def calculate_scores(confidence, websites, socials, street=None, house_number=No
     
     # ICONIC BOOST: AI-identified iconic venues
     if is_iconic:
-        relevance += 100  # Guarantees cap at 100
+        relevance += ICONIC_BONUS  # Guarantees cap at 100
         bonus_flags['iconic_bonus'] = True
     
     # SOCIAL SIGNALS
@@ -0,0 +1,75 @@
+"""
+Curation Rules - Regression Tests
+
+Validates that the compiled (single-regex) scoring modifiers match the
+plain config walk in scoring.apply_scoring_modifiers:
+1. Hierarchy keywords sharing a prefix resolve to the strongest penalty
+2. Keyword config order does not change the result
+
+Run from scripts/: python -m hydration.test_curation_rules (or pytest)
+(not as a plain script - hydration/queue.py would shadow the stdlib queue)
+"""
+
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from hydration.utils import compile_curation_rules
+from hydration.scoring import apply_scoring_modifiers
+from hydrate_overture_city import _resolve_scoring_modifier
+
+
+def build_config(keyword_penalties):
+    """Minimal curation config with only hierarchy keyword penalties."""
+    config = {
+        'categories': {
+            'scoring_modifiers': {
+                'penalties': {'taxonomy_hierarchy_keywords': keyword_penalties},
+            }
+        }
+    }
+    config['compiled'] = compile_curation_rules(config)
+    return config
+
+
+def test_shared_prefix_keywords():
+    """Test that a stronger keyword starting where a weaker one starts still wins."""
+    print("🧪 Test 1: Shared-prefix Hierarchy Keywords")
+    
+    config = build_config({'food': 0.5, 'food_court': 0.35})
+    modifier = _resolve_scoring_modifier(config['compiled'], 'food_court', None, 'restaurant')
+    
+    assert modifier == 0.35
+    assert modifier == apply_scoring_modifiers(100, 'restaurant', 'food_court', config)[1]
+    print("  ✅ 'food_court' → 0.35 (not 'food' 0.5)")
+    
+    print()
+
+
+def test_keyword_order_independent():
+    """Test that config order of overlapping keywords does not change the modifier."""
+    print("🧪 Test 2: Keyword Order Independence")
+    
+    for keyword_penalties in ({'food': 0.5, 'food_court': 0.35}, {'food_court': 0.35, 'food': 0.5},
+                              {'food': 0.2, 'food_court': 0.35}):
+        config = build_config(keyword_penalties)
+        compiled = _resolve_scoring_modifier(config['compiled'], 'food_court', None, 'restaurant')
+        baseline = apply_scoring_modifiers(100, 'restaurant', 'food_court', config)[1]
+        assert compiled == baseline == min(keyword_penalties.values())
+        print(f"  ✅ {keyword_penalties} → {compiled}")
+    
+    print()
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Curation Rules - Regression Test Suite")
+    print("=" * 60)
+    print()
+    
+    test_shared_prefix_keywords()
+    test_keyword_order_independent()
+    
+    print("=" * 60)
+    print(" ALL TESTS PASSED")
+    print("=" * 60)
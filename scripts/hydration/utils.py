@@ -3,6 +3,17 @@ Utility functions for POI hydration.
 Includes configuration loading, name sanitization, and category mapping.
 """
 import json
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, Optional, Pattern, Tuple
+
+# orjson for fast JSON encoding (optional - falls back to stdlib json)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 
 def load_config(config_path):
@@ -20,15 +31,130 @@ def build_category_map(config):
     return category_map
 
 
-def sanitize_name(name, config):
-    """Remove company suffixes and validate against blacklist."""
+def dumps_json_bytes(value):
+    """Serialize value to UTF-8 JSON bytes (orjson when available)."""
+    if HAS_ORJSON:
+        return orjson.dumps(value)
+    return json.dumps(value).encode('utf-8')
+
+
+def dumps_json_text(value, indent=False):
+    """Serialize value to a JSON str, non-ASCII kept as-is (orjson when available).
+    
+    Compact (no whitespace) unless indent is set.
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2 if indent else 0).decode('utf-8')
+    if indent:
+        return json.dumps(value, ensure_ascii=False, indent=2)
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+
+def loads_json(data):
+    """Parse a JSON str/bytes document (orjson when available)."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@lru_cache(maxsize=4096)
+def lower_category(value):
+    """Cached lowercase for low-cardinality category strings ('' for None)."""
+    return value.lower() if value else ''
+
+
+def compile_term_pattern(terms):
+    """Compile substring terms into a single overlapping-match regex.
+    
+    The lookahead reports a match at every position, so findall() returns
+    every term that occurs in the text in one pass. At the same position the
+    earlier term in `terms` wins, so callers pass terms in priority order.
+    """
+    if not terms:
+        return None
+    return re.compile('(?=(' + '|'.join(re.escape(t) for t in terms) + '))')
+
+
+@dataclass(slots=True)
+class CompiledConfig:
+    """Curation rules resolved once per run (stored at config['compiled']).
+    
+    Hot-loop helpers read these attributes instead of walking the nested
+    config dicts with chained .get() calls for every POI.
+    """
+    weight_pattern: Optional[Pattern]          # taxonomy weight terms, priority order
+    weight_terms: Dict[str, Tuple[int, Any]]   # term → (group priority, bonus)
+    keyword_pattern: Optional[Pattern]         # hierarchy penalty keywords
+    keyword_penalties: Dict[str, float]        # keyword → penalty
+    taxonomy_primary: Dict[str, float]         # primary category → penalty
+    internal_boosts: Dict[str, float]          # internal category → boost
+    has_modifiers: bool
+    osm_red_flag_patterns: Dict[str, Pattern]  # OSM tag key → one regex over its red-flag values
+    name_blacklist_pattern: Optional[Pattern]  # one regex over every blacklisted name term
+    base_scoring: Dict[str, Any]               # scoring_modifiers.base_scoring points
+    # (overture, hierarchy, internal) → resolved scoring modifier
+    modifier_cache: Dict[tuple, float] = field(default_factory=dict)
+
+
+def compile_curation_rules(config):
+    """Flatten taxonomy weights and scoring modifiers into single-pass matchers.
+    
+    Returns a CompiledConfig, stored at config['compiled'] by load_curation_config.
+    """
+    weight_terms = {}
+    for priority, weight_data in enumerate(config.get('taxonomy', {}).get('taxonomy_weights', {}).values()):
+        for term in weight_data['categories']:
+            # First group listing a term keeps it (same as the nested loop order)
+            weight_terms.setdefault(term.lower(), (priority, weight_data['bonus']))
+    
+    modifiers = config.get('categories', {}).get('scoring_modifiers', {})
+    penalties = modifiers.get('penalties', {})
+    keyword_penalties = {
+        k.lower(): v for k, v in penalties.get('taxonomy_hierarchy_keywords', {}).items()
+    }
+    
+    return CompiledConfig(
+        weight_pattern=compile_term_pattern(sorted(weight_terms, key=lambda t: weight_terms[t][0])),
+        weight_terms=weight_terms,
+        # Strongest (lowest) penalty first: at a shared start position only the
+        # earliest listed keyword is reported ('food_court' must beat 'food')
+        keyword_pattern=compile_term_pattern(sorted(keyword_penalties, key=keyword_penalties.get)),
+        keyword_penalties=keyword_penalties,
+        taxonomy_primary=penalties.get('taxonomy_primary', {}),
+        internal_boosts=modifiers.get('boosts', {}).get('internal_category', {}),
+        has_modifiers=bool(modifiers),
+        osm_red_flag_patterns={
+            key: compile_term_pattern([v.lower() for v in values])
+            for key, values in config.get('taxonomy', {}).get('osm_red_flags', {}).items()
+            if values
+        },
+        name_blacklist_pattern=compile_term_pattern(
+            [term.lower() for term in config.get('names', {}).get('blacklist', ())]
+        ),
+        base_scoring=modifiers.get('base_scoring', {}),
+    )
+
+
+def sanitize_name(name, config, name_lower=None):
+    """Remove company suffixes and validate against blacklist.
+    
+    name_lower: optional pre-lowercased name (avoids re-lowercasing in hot loops)
+    """
     if not name:
         return None
     
-    name_lower = name.lower()
-    for term in config['names']['blacklist']:
-        if term in name_lower:
+    if name_lower is None:
+        name_lower = name.lower()
+    compiled = config.get('compiled')
+    if compiled is not None:
+        # Single regex pass instead of one substring scan per blacklist term
+        pattern = compiled.name_blacklist_pattern
+        if pattern is not None and pattern.search(name_lower):
             return None
+    else:
+        for term in config['names']['blacklist']:
+            if term in name_lower:
+                return None
     
     cleaned = name
     for suffix in config['names']['suffixes_to_remove']:
@@ -44,6 +170,13 @@ def sanitize_name(name, config):
     return cleaned
 
 
+# Address patterns for parse_street_address (compiled once at import)
+_PAT_NUM_START = re.compile(r'^(\d+[\w/-]*)\s+(.+)$')
+_PAT_COMMA = re.compile(r'^(.+?),\s*(\d+[\w/-]*)$')
+_PAT_NUM_END = re.compile(r'^(.+?)\s+(\d+[\w/-]*)$')
+_PAT_NUM_SUFFIX = re.compile(r'^\d+[A-Za-z]?$')
+
+
 def parse_street_address(freeform):
     """
     Extract street name and house number from freeform address.
@@ -60,31 +193,34 @@ def parse_street_address(freeform):
     Returns:
         Tuple of (street_name, house_number)
     """
-    import re
-    
     if not freeform:
         return (None, None)
     
     freeform = freeform.strip()
     
+    # Fast path: every pattern needs a digit, so skip the regexes entirely
+    if not any(ch.isdigit() for ch in freeform):
+        return (freeform, None)
+    
     # Pattern 1: Number at start (English: "123 Main Street")
-    match = re.match(r'^(\d+[\w/-]*)\s+(.+)$', freeform)
-    if match:
-        return (match.group(2), match.group(1))
+    if freeform[:1].isdigit():
+        match = _PAT_NUM_START.match(freeform)
+        if match:
+            return (match.group(2), match.group(1))
     
     # Pattern 2: Number after comma (Brazilian: "Rua Nome, 123")
-    match = re.match(r'^(.+?),\s*(\d+[\w/-]*)$', freeform)
-    if match:
-        return (match.group(1), match.group(2))
+    if ',' in freeform:
+        match = _PAT_COMMA.match(freeform)
+        if match:
+            return (match.group(1), match.group(2))
     
     # Pattern 3: Number at end (no comma: "Avenida Paulista 1000")
-    match = re.match(r'^(.+?)\s+(\d+[\w/-]*)$', freeform)
+    match = _PAT_NUM_END.match(freeform)
     if match:
         street, number = match.group(1), match.group(2)
         # Only extract if clearly numeric (avoid "XV de Novembro" → "XV de", "Novembro")
-        if number.isdigit() or re.match(r'^\d+[A-Za-z]?$', number):
+        if number.isdigit() or _PAT_NUM_SUFFIX.match(number):
             return (street, number)
     
     # No number found - return address as-is
     return (freeform, None)
-
@@ -2,11 +2,16 @@
 POI validation functions.
 Includes category validation, taxonomy checks, and OSM filtering.
 """
+from .utils import compile_curation_rules, lower_category
 
 
-def validate_category_name(name, category, original_category, config):
-    """Validate consistency between category and name."""
-    name_lower = name.lower()
+def validate_category_name(name, category, original_category, config, name_lower=None):
+    """Validate consistency between category and name.
+    
+    name_lower: optional pre-lowercased name (avoids re-lowercasing in hot loops)
+    """
+    if name_lower is None:
+        name_lower = name.lower()
     
     rules = config['taxonomy']['cross_validation_rules']
     
@@ -26,7 +31,7 @@ def validate_category_name(name, category, original_category, config):
 
 
 def check_taxonomy_hierarchy(category_tags, overture_category, alternate_categories, config,
-                              taxonomy_hierarchy=None):
+                              taxonomy_hierarchy=None, overture_lower=None):
     """Check if the PRIMARY category is valid (not in forbidden list).
     
     IMPORTANT: We only check the PRIMARY category, not alternates.
@@ -38,19 +43,23 @@ def check_taxonomy_hierarchy(category_tags, overture_category, alternate_categor
     The alternate 'adult_entertainment' doesn't disqualify it because the PRIMARY
     category is dance_club (a legitimate nightclub). Alternates may indicate
     secondary characteristics (e.g., pole dancing) but don't define the venue type.
+    
+    overture_lower: optional pre-lowercased overture_category
     """
     # Get forbidden terms from taxonomy config
     taxonomy_config = config.get('taxonomy', {})
     forbidden_terms = taxonomy_config.get('forbidden_hierarchy_terms', [])
     
     # ONLY check the primary category (not alternates!)
-    if overture_category and overture_category.lower() in forbidden_terms:
+    if overture_lower is None:
+        overture_lower = lower_category(overture_category)
+    if overture_lower and overture_lower in forbidden_terms:
         return False
     
     # Also scan the full hierarchy path for forbidden ancestors
     if taxonomy_hierarchy:
         for ancestor in (taxonomy_hierarchy or []):
-            if ancestor and ancestor.lower() in forbidden_terms:
+            if ancestor and lower_category(ancestor) in forbidden_terms:
                 return False
     
     # Accept - primary category and hierarchy are valid
@@ -66,17 +75,13 @@ def filter_osm_red_flags(category_tags, config):
     if not category_tags:
         return False  # No tags = accept
     
-    taxonomy_config = config.get('taxonomy', {})
-    osm_red_flags = taxonomy_config.get('osm_red_flags', {})
+    compiled = config.get('compiled') or compile_curation_rules(config)
     
     # category_tags is a dict, not a string!
-    # Check if any red flag matches
-    for osm_key, red_flag_values in osm_red_flags.items():
+    # Check if any red flag matches (one precompiled regex per OSM key)
+    for osm_key, red_flag_pattern in compiled.osm_red_flag_patterns.items():
         tag_value = category_tags.get(osm_key)
-        if tag_value:
-            tag_value_lower = str(tag_value).lower()
-            for flag in red_flag_values:
-                if flag.lower() in tag_value_lower:
-                    return True  # Reject - has red flag
+        if tag_value and red_flag_pattern.search(str(tag_value).lower()):
+            return True  # Reject - has red flag
     
     return False  # Accept - no red flags found